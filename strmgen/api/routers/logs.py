@@ -17,6 +17,10 @@ import re
 from fastapi import Request
 from logging import _nameToLevel
 
+# compiled once; every queued line goes through both
+_LEVEL_RE    = re.compile(r"\b(INFO|DEBUG|WARNING|ERROR|CRITICAL)\b")
+_CATEGORY_RE = re.compile(r"\[(.*?)\]")
+
 @router.get("/stream/logs", name="logs.stream_logs")
 async def stream_logs(request: Request):
     """
@@ -35,14 +39,14 @@ async def stream_logs(request: Request):
                 line = await log_queue.get()
 
                 # Level check
-                if m := re.search(r"\b(INFO|DEBUG|WARNING|ERROR|CRITICAL)\b", line):
+                if m := _LEVEL_RE.search(line):
                     line_level = _nameToLevel.get(m.group(1), logging.INFO)
                     if line_level < level:
                         continue
 
                 # Category match (if specified)
                 if categories:
-                    cat_match = re.search(r"\[(.*?)\]", line)
+                    cat_match = _CATEGORY_RE.search(line)
                     if not cat_match:
                         continue
                     log_cat = cat_match.group(1).upper()
@@ -2,24 +2,17 @@ import asyncio
 
 from fastapi import APIRouter, HTTPException, Depends
 from strmgen.pipeline.runner import scheduler, schedule_history
+from apscheduler.jobstores.base import JobLookupError
 from apscheduler.triggers.cron import CronTrigger
 from strmgen.core.config import save_settings, get_settings, Settings
 from strmgen.api.schemas import ScheduleResponse, ScheduleUpdate
 
 router = APIRouter(tags=["Schedule"])
 
-@router.get(
-    "", 
-    response_model=ScheduleResponse, 
-    name="schedule.get_schedule"
-)
-async def get_schedule(
-    cfg: Settings = Depends(get_settings)
-):
-    job      = scheduler.get_job("daily_run") if cfg.enable_scheduled_task else None
+def _schedule_response(cfg: Settings, job) -> ScheduleResponse:
+    """Build the response from an already-resolved job (one attribute read each)."""
     next_run = job.next_run_time if job else None
     last_run = schedule_history.get("daily_run") if job else None
-
     return ScheduleResponse(
         enabled  = cfg.enable_scheduled_task,
         hour     = cfg.scheduled_hour,
@@ -28,6 +21,17 @@ async def get_schedule(
         last_run = last_run.isoformat() if last_run else None,
     )
 
+@router.get(
+    "", 
+    response_model=ScheduleResponse, 
+    name="schedule.get_schedule"
+)
+async def get_schedule(
+    cfg: Settings = Depends(get_settings)
+):
+    job = scheduler.get_job("daily_run") if cfg.enable_scheduled_task else None
+    return _schedule_response(cfg, job)
+
 @router.post(
     "", 
     response_model=ScheduleResponse, 
@@ -41,11 +45,17 @@ async def update_schedule(
     if not (0 <= u.hour < 24 and 0 <= u.minute < 60):
         raise HTTPException(400, "hour must be 0–23 and minute 0–59")
 
-    # reschedule in‑memory
-    scheduler.reschedule_job(
-        "daily_run",
-        trigger=CronTrigger(hour=u.hour, minute=u.minute)
-    )
+    # reschedule in‑memory; reschedule_job hands back the job, so no second
+    # lookup is needed (and there is no job when the schedule is disabled)
+    job = None
+    if cfg.enable_scheduled_task:
+        try:
+            job = scheduler.reschedule_job(
+                "daily_run",
+                trigger=CronTrigger(hour=u.hour, minute=u.minute)
+            )
+        except JobLookupError:
+            job = None
 
     # persist to disk (and update in‑memory cfg)
     cfg.scheduled_hour   = u.hour
@@ -53,14 +63,4 @@ async def update_schedule(
     await asyncio.to_thread(save_settings, cfg)
 
     # return updated schedule
-    job      = scheduler.get_job("daily_run")
-    next_run = job.next_run_time if job else None
-    last_run = schedule_history.get("daily_run") if job else None
-    
-    return ScheduleResponse(
-        enabled  = cfg.enable_scheduled_task,
-        hour     = cfg.scheduled_hour,
-        minute   = cfg.scheduled_minute,
-        next_run = next_run.isoformat() if next_run else None,
-        last_run = last_run.isoformat() if last_run else None,
-    )
\ No newline at end of file
+    return _schedule_response(cfg, job)
\ No newline at end of file
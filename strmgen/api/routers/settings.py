@@ -37,8 +37,6 @@ class SettingsOut(BaseModel):
     groups_24_7: List[str]
     remove_strings: List[str]
 
-    batch_size: int
-    batch_delay_seconds: float
     concurrent_requests: int
     tmdb_rate_limit: int
 
@@ -102,8 +100,6 @@ class SettingsIn(BaseModel):
     groups_24_7: List[str]
     remove_strings: List[str]
 
-    batch_size: int
-    batch_delay_seconds: float
     concurrent_requests: int
     tmdb_rate_limit: int
 
@@ -165,8 +161,6 @@ class SettingsPatch(BaseModel):
     groups_24_7:                   Optional[List[str]] = None
     remove_strings:                Optional[List[str]] = None
 
-    batch_size:                   Optional[int]   = None
-    batch_delay_seconds:          Optional[int]   = None
     concurrent_requests:          Optional[int]   = None
     tmdb_rate_limit:              Optional[int]   = None
 
@@ -7,6 +7,7 @@ from strmgen.services.streams import (
 )
 from strmgen.core.db import (
     list_skipped,
+    set_reprocess_many,
     update_skipped_reprocess,
     SkippedStream
 )
@@ -32,6 +33,22 @@ async def skipped_streams(stream_type: str | None = Query(None)):
 
 
 
+@router.post("/skipped-streams/reprocess", name="skipped.reprocess_many")
+async def api_set_reprocess_many(payload: dict = Body(...)):
+    """
+    Update the `reprocess` flag for many skipped streams in one statement.
+    Body: {"tmdb_ids": [...], "reprocess": bool, "stream_type": optional str}
+    """
+    ids = payload.get("tmdb_ids")
+    if not isinstance(ids, list) or "reprocess" not in payload:
+        raise HTTPException(400, "Body requires 'tmdb_ids' (list) and 'reprocess'")
+    try:
+        updated = await set_reprocess_many(ids, bool(payload["reprocess"]), payload.get("stream_type"))
+    except (TypeError, ValueError):
+        raise HTTPException(400, "'tmdb_ids' must be integers")
+    return {"status": "ok", "updated": updated}
+
+
 @router.post("/skipped-streams/{stream_type}/{tmdb_id}/reprocess", name="skipped.reprocess_stream")
 async def api_set_reprocess(
     stream_type: str,
@@ -48,7 +65,7 @@ async def api_set_reprocess(
     if bool(payload["reprocess"]):
         # Reprocess the stream
         try:
-            skipped = list_skipped(stream_type, tmdb_id)
+            skipped = await list_skipped(stream_type, tmdb_id)
             for s in skipped:
                 if s["tmdb_id"] == tmdb_id:
                     if s["stream_type"].lower() == "movie":
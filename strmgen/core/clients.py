@@ -4,14 +4,26 @@ from httpx import AsyncClient, Limits, Timeout
 from aiolimiter import AsyncLimiter
 
 from strmgen.core.config import get_settings
+from strmgen.core.models.enums import MediaType
 
 # Load settings once into module-level variable for client configuration
 settings = get_settings()
 
-# one-and-only AsyncClient for your entire app
+# The 24/7, movie and TV categories run side by side, each with
+# concurrent_requests workers, all sharing async_client
+_pipeline_workers = max(1, settings.concurrent_requests) * len(MediaType)
+
+# one-and-only AsyncClient for your entire app; the pool covers every
+# pipeline worker plus headroom for the API routes, and keep-alive sockets
+# are reused across groups
 async_client = AsyncClient(
     base_url=settings.api_base,
-    timeout=Timeout(10.0)
+    limits=Limits(
+        max_connections=_pipeline_workers + max(1, settings.concurrent_requests),
+        max_keepalive_connections=_pipeline_workers,
+        keepalive_expiry=60
+    ),
+    timeout=Timeout(10.0, connect=5.0)
 )
 
 # Constants
@@ -19,23 +31,28 @@ TMDB_BASE = "https://api.themoviedb.org/3"
 TMDB_IMG_BASE = "https://image.tmdb.org/t/p"
 
 # Shared HTTP Clients for TMDb
-# Configured with connection limits and timeouts
+# Configured with connection limits and timeouts; HTTP/2 multiplexes
+# requests over the kept-alive TLS connection
 tmdb_client = AsyncClient(
     base_url=TMDB_BASE,
+    http2=True,
     limits=Limits(
         max_connections=20,
-        max_keepalive_connections=10
+        max_keepalive_connections=10,
+        keepalive_expiry=60
     ),
-    timeout=Timeout(10.0)
+    timeout=Timeout(10.0, connect=5.0)
 )
 
 tmdb_image_client = AsyncClient(
     base_url=TMDB_IMG_BASE,
+    http2=True,
     limits=Limits(
         max_connections=20,
-        max_keepalive_connections=10
+        max_keepalive_connections=10,
+        keepalive_expiry=60
     ),
-    timeout=Timeout(10.0)
+    timeout=Timeout(10.0, connect=5.0)
 )
 
 # Rate limiter parameterized by settings
@@ -44,8 +61,15 @@ tmdb_limiter = AsyncLimiter(
     time_period=10
 )
 
-# Centralized Emby client
+# Centralized Emby client; one lookup per movie during a run, so keep a
+# bounded pool of kept-alive connections instead of httpx's defaults
 emby_client = httpx.AsyncClient(
     base_url=settings.emby_api_url,
-    headers={"X-Emby-Token": settings.emby_api_key}
+    headers={"X-Emby-Token": settings.emby_api_key},
+    limits=Limits(
+        max_connections=settings.concurrent_requests * 2,
+        max_keepalive_connections=settings.concurrent_requests,
+        keepalive_expiry=60
+    ),
+    timeout=Timeout(10.0, connect=5.0)
 )
\ No newline at end of file
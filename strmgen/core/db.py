@@ -5,8 +5,7 @@ import asyncpg
 import asyncio
 import logging
 
-from typing import TypedDict, Optional, Any, List
-from dataclasses import is_dataclass, asdict
+from typing import TypedDict, Optional, Any, Dict, Iterable, List, Sequence, Set, Tuple
 
 from strmgen.core.config import get_settings
 from strmgen.core.models.dispatcharr import DispatcharrStream
@@ -16,6 +15,35 @@ logger = logging.getLogger(__name__)
 _pool: asyncpg.Pool | None = None
 _pool_lock = asyncio.Lock()
 
+# Hot-path SQL kept as constants so every call sends identical text and hits
+# asyncpg's per-connection statement cache.
+IS_SKIPPED_SQL = """
+    SELECT 1
+      FROM skipped_streams
+     WHERE stream_type = $1
+       AND dispatcharr_id = $2
+       AND reprocess = FALSE
+"""
+
+IS_SKIPPED_MANY_SQL = """
+    SELECT dispatcharr_id
+      FROM skipped_streams
+     WHERE stream_type = $1
+       AND dispatcharr_id = ANY($2::bigint[])
+       AND reprocess = FALSE
+"""
+
+async def _prepare_stmts(conn: asyncpg.Connection) -> None:
+    """
+    Pool init hook: prime the statement cache of each new connection with the
+    skip-check query, so the per-stream lookup only sends Bind/Execute.
+    """
+    try:
+        await conn.fetchrow(IS_SKIPPED_SQL, "", -1)
+    except asyncpg.UndefinedTableError:
+        # first start-up: the table is created after the pool exists
+        pass
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Connection Pool Access
 # ─────────────────────────────────────────────────────────────────────────────
@@ -25,13 +53,33 @@ async def get_pg_pool() -> asyncpg.Pool:
         async with _pool_lock:
             if _pool is None:
                 settings = get_settings()
-                _pool = await asyncpg.create_pool(dsn=settings.postgres_dsn)
+                _pool = await asyncpg.create_pool(
+                    dsn=settings.postgres_dsn,
+                    min_size=settings.pg_pool_min,
+                    max_size=max(settings.pg_pool_max, settings.pg_pool_min),
+                    max_inactive_connection_lifetime=300,
+                    statement_cache_size=1024,
+                    max_cached_statement_lifetime=300,
+                    command_timeout=60,
+                    init=_prepare_stmts,
+                )
     return _pool
 
 async def init_pg_pool() -> None:
     """Explicit init (optional). Usually prefer get_pg_pool()."""
     await get_pg_pool()
 
+def get_pool_stats() -> dict[str, int]:
+    """Snapshot of pool occupancy, for observability."""
+    if _pool is None:
+        return {"size": 0, "idle": 0, "min_size": 0, "max_size": 0}
+    return {
+        "size": _pool.get_size(),
+        "idle": _pool.get_idle_size(),
+        "min_size": _pool.get_min_size(),
+        "max_size": _pool.get_max_size(),
+    }
+
 async def close_pg_pool() -> None:
     """Close the asyncpg connection pool."""
     global _pool
@@ -43,68 +91,188 @@ async def close_pg_pool() -> None:
 # State-management API
 # ─────────────────────────────────────────────────────────────────────────────
 async def is_skipped(stream_type: str, dispatcharr_id: int) -> bool:
-    """Check if a stream is marked skipped in the DB."""
+    """Check if a stream is marked skipped, in the DB or still in the write buffer."""
+    key = (stream_type, dispatcharr_id)
+    if key in _pending_skips:
+        return True
+    prefetched = _prefetched_skips.pop(key, None)
+    if prefetched is not None:
+        return prefetched
     pool = await get_pg_pool()
-    row = await pool.fetchrow(
-        """
-        SELECT 1
-          FROM skipped_streams
-         WHERE stream_type = $1
-           AND dispatcharr_id = $2
-           AND reprocess = FALSE
-        """,
-        stream_type, dispatcharr_id
-    )
+    row = await pool.fetchrow(IS_SKIPPED_SQL, stream_type, dispatcharr_id)
     return row is not None
 
-async def mark_skipped(stream_type: str, group: str, mshow: Any, stream: DispatcharrStream) -> bool:
-    """Upsert a skipped_streams record for a given stream."""
-    if is_dataclass(mshow):
-        data_dict = asdict(mshow) if not isinstance(mshow, type) else {}
-    elif hasattr(mshow, "raw"):
-        data_dict = mshow.raw
-    else:
-        data_dict = getattr(mshow, "__dict__", {})
-
-    dispatcharr_id = stream.id
-    tmdb_id = None
-    for key in ("id", "tmdb_id", "movie_id", "show_id"):
-        if key in data_dict and data_dict[key] is not None:
-            tmdb_id = data_dict[key]
-            break
-    if tmdb_id is None:
-        tmdb_id = getattr(mshow, "id", None) or getattr(mshow, "tmdb_id", None)
-
-    name = None
-    for key in ("name", "title", "original_name"):
-        if key in data_dict and data_dict[key]:
-            name = data_dict[key]
-            break
-    if name is None:
-        name = getattr(mshow, "name", None) or getattr(mshow, "title", None)
+SkippedRow = Tuple[int, int, str, str, str]
+"""(tmdb_id, dispatcharr_id, stream_type, group_name, name)"""
+
+_SKIPPED_COLUMNS = ["tmdb_id", "dispatcharr_id", "stream_type", "group_name", "name"]
+
+UPSERT_SKIPPED_SQL = """
+    INSERT INTO skipped_streams
+    (tmdb_id, dispatcharr_id, stream_type, group_name, name, reprocess)
+    VALUES ($1, $2, $3, $4, $5, FALSE)
+    ON CONFLICT (tmdb_id)
+    DO UPDATE SET
+        dispatcharr_id=EXCLUDED.dispatcharr_id,
+        stream_type=EXCLUDED.stream_type,
+        group_name=EXCLUDED.group_name,
+        name=EXCLUDED.name,
+        reprocess=EXCLUDED.reprocess;
+"""
+
+# Batches at or above this size are staged with COPY and merged in one statement
+SKIP_COPY_THRESHOLD = 500
+# Buffered skip rows are flushed once this many accumulate
+SKIP_FLUSH_SIZE = 500
+
+_skip_buffer: List[SkippedRow] = []
+# (stream_type, dispatcharr_id) of rows queued but not yet written, so
+# is_skipped sees them before the next flush
+_pending_skips: Set[Tuple[str, int]] = set()
+# skip state loaded a page at a time by prefetch_skipped; each entry is
+# consumed by the is_skipped call for that stream
+_prefetched_skips: Dict[Tuple[str, int], bool] = {}
+
+
+def _first_attr(obj: Any, keys: Tuple[str, ...], truthy: bool) -> Any:
+    """First attribute/key of obj that is set (non-None, or truthy if requested)."""
+    for key in keys:
+        value = getattr(obj, key, None)
+        if value is None and isinstance(obj, dict):
+            value = obj.get(key)
+        if value if truthy else value is not None:
+            return value
+    return None
+
+
+def _skipped_row(stream_type: str, group: str, mshow: Any, stream: DispatcharrStream) -> Optional[SkippedRow]:
+    """Build the skipped_streams row for a stream, or None if it can't be keyed."""
+    id_keys = ("id", "tmdb_id", "movie_id", "show_id")
+    name_keys = ("name", "title", "original_name")
+
+    # read the two scalars directly; only fall back to the raw TMDb payload
+    tmdb_id = _first_attr(mshow, id_keys, truthy=False)
+    name = _first_attr(mshow, name_keys, truthy=True)
+    raw = getattr(mshow, "raw", None)
+    if isinstance(raw, dict):
+        if tmdb_id is None:
+            tmdb_id = _first_attr(raw, id_keys, truthy=False)
+        if not name:
+            name = _first_attr(raw, name_keys, truthy=True)
 
     if tmdb_id is None or not name:
         logger.warning("Skipped insert: missing tmdb_id or name for %r", mshow)
-        return False
+        return None
+    return (tmdb_id, stream.id, stream_type, group, name)
+
 
+async def is_skipped_many(stream_type: str, ids: Sequence[int]) -> Set[int]:
+    """Return the subset of dispatcharr ids that are marked skipped, in one query."""
+    if not ids:
+        return set()
     pool = await get_pg_pool()
-    await pool.execute(
-        """
-        INSERT INTO skipped_streams
-        (tmdb_id, dispatcharr_id, stream_type, group_name, name, reprocess)
-        VALUES ($1, $2, $3, $4, $5, FALSE)
-        ON CONFLICT (tmdb_id)
-        DO UPDATE SET
-            dispatcharr_id=EXCLUDED.dispatcharr_id,
-            stream_type=EXCLUDED.stream_type,
-            group_name=EXCLUDED.group_name,
-            name=EXCLUDED.name,
-            reprocess=EXCLUDED.reprocess;
-        """,
-        tmdb_id, dispatcharr_id, stream_type, group, name
-    )
+    rows = await pool.fetch(IS_SKIPPED_MANY_SQL, stream_type, list(ids))
+    skipped = {r[0] for r in rows}
+    # rows still waiting in the write buffer count as skipped too
+    skipped.update(i for i in ids if (stream_type, i) in _pending_skips)
+    return skipped
+
+
+async def prefetch_skipped(stream_type: str, ids: Sequence[int]) -> None:
+    """Load the skip state of a page of streams in one query, for is_skipped to use."""
+    skipped = await is_skipped_many(stream_type, ids)
+    for i in ids:
+        _prefetched_skips[(stream_type, i)] = i in skipped
+
+
+def clear_skip_prefetch() -> None:
+    """Forget prefetched skip state, e.g. left over from a stopped run."""
+    _prefetched_skips.clear()
+
+
+async def mark_skipped_many(batch: List[SkippedRow]) -> None:
+    """
+    Upsert many skipped_streams rows in one round-trip.
+
+    Small batches go through executemany; large ones are COPY'd into a
+    temp staging table and merged with a single INSERT ... ON CONFLICT.
+    """
+    if not batch:
+        return
+    # ON CONFLICT can't touch the same row twice in one statement: last write wins
+    rows = list({row[0]: row for row in batch}.values())
+
+    pool = await get_pg_pool()
+    async with pool.acquire() as conn:
+        if len(rows) < SKIP_COPY_THRESHOLD:
+            await conn.executemany(UPSERT_SKIPPED_SQL, rows)
+            return
+
+        async with conn.transaction():
+            await conn.execute(
+                """
+                CREATE TEMP TABLE _skip_stage
+                (LIKE skipped_streams INCLUDING DEFAULTS)
+                ON COMMIT DROP
+                """
+            )
+            await conn.copy_records_to_table(
+                "_skip_stage", records=rows, columns=_SKIPPED_COLUMNS
+            )
+            await conn.execute(
+                """
+                INSERT INTO skipped_streams
+                (tmdb_id, dispatcharr_id, stream_type, group_name, name, reprocess)
+                SELECT tmdb_id, dispatcharr_id, stream_type, group_name, name, FALSE
+                  FROM _skip_stage
+                ON CONFLICT (tmdb_id)
+                DO UPDATE SET
+                    dispatcharr_id=EXCLUDED.dispatcharr_id,
+                    stream_type=EXCLUDED.stream_type,
+                    group_name=EXCLUDED.group_name,
+                    name=EXCLUDED.name,
+                    reprocess=EXCLUDED.reprocess;
+                """
+            )
+
+
+async def mark_skipped(stream_type: str, group: str, mshow: Any, stream: DispatcharrStream) -> bool:
+    """Upsert a skipped_streams record for a given stream."""
+    row = _skipped_row(stream_type, group, mshow, stream)
+    if row is None:
+        return False
+    await mark_skipped_many([row])
     return True
 
+
+async def queue_skipped(stream_type: str, group: str, mshow: Any, stream: DispatcharrStream) -> bool:
+    """
+    Buffer a skipped_streams record; the buffer is written in bulk once it
+    reaches SKIP_FLUSH_SIZE or when flush_skipped() is called after each group.
+    """
+    row = _skipped_row(stream_type, group, mshow, stream)
+    if row is None:
+        return False
+    _skip_buffer.append(row)
+    _pending_skips.add((row[2], row[1]))
+    if len(_skip_buffer) >= SKIP_FLUSH_SIZE:
+        await flush_skipped()
+    return True
+
+
+async def flush_skipped() -> None:
+    """Write any buffered skipped_streams records."""
+    if not _skip_buffer:
+        return
+    batch = _skip_buffer[:]
+    _skip_buffer.clear()
+    try:
+        await mark_skipped_many(batch)
+    finally:
+        # keep keys that were queued again while this batch was being written
+        requeued = {(r[2], r[1]) for r in _skip_buffer}
+        _pending_skips.difference_update({(r[2], r[1]) for r in batch} - requeued)
+
 class SkippedStream(TypedDict):
     tmdb_id: int
     dispatcharr_id: int
@@ -113,28 +281,30 @@ class SkippedStream(TypedDict):
     name: str
     reprocess: bool
 
+# NULL parameters disable their predicate, so one statement covers every filter combination
+LIST_SKIPPED_SQL = """
+    SELECT tmdb_id, dispatcharr_id, stream_type, group_name AS group, name, reprocess
+      FROM skipped_streams
+     WHERE ($1::text IS NULL OR stream_type = $1)
+       AND ($2::bigint IS NULL OR tmdb_id = $2)
+"""
+
 async def list_skipped(
     stream_type: Optional[str] = None,
     tmdb_id: Optional[int] = None
 ) -> List[SkippedStream]:
     """List skipped streams, optionally filtering by type or tmdb_id."""
-    clauses: list[str] = []
-    params: list[Any] = []
-    if stream_type is not None:
-        clauses.append(f"stream_type = ${len(params)+1}")
-        params.append(stream_type)
-    if tmdb_id is not None:
-        clauses.append(f"tmdb_id = ${len(params)+1}")
-        params.append(tmdb_id)
-    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
-    sql = (
-        "SELECT tmdb_id, dispatcharr_id, stream_type, group_name AS group, "
-        "name, reprocess FROM skipped_streams " + where
-    )
     pool = await get_pg_pool()
-    rows = await pool.fetch(sql, *params)
+    rows = await pool.fetch(LIST_SKIPPED_SQL, stream_type, tmdb_id)
     return [dict(r) for r in rows]
 
+SET_REPROCESS_MANY_SQL = """
+    UPDATE skipped_streams
+       SET reprocess = $1
+     WHERE tmdb_id = ANY($2::bigint[])
+       AND ($3::text IS NULL OR stream_type = $3)
+"""
+
 async def set_reprocess(tmdb_id: int, allow: bool) -> None:
     """Set reprocess flag for a skipped stream."""
     pool = await get_pg_pool()
@@ -143,6 +313,26 @@ async def set_reprocess(tmdb_id: int, allow: bool) -> None:
         allow, tmdb_id
     )
 
+async def set_reprocess_many(
+    ids: Iterable[int],
+    allow: bool,
+    stream_type: Optional[str] = None,
+) -> int:
+    """
+    Set the reprocess flag for many skipped streams in one statement.
+    Optionally limited to one stream_type. Returns the number of rows updated.
+    """
+    id_list = list({int(i) for i in ids})
+    if not id_list:
+        return 0
+    pool = await get_pg_pool()
+    status = await pool.execute(
+        SET_REPROCESS_MANY_SQL,
+        allow, id_list, stream_type
+    )
+    # asyncpg returns the command tag, e.g. "UPDATE 12"
+    return int(status.split()[-1])
+
 async def update_skipped_reprocess(tmdb_id: int, stream_type: str, reprocess: bool) -> None:
     """Update reprocess for a specific tmdb_id and stream_type."""
     pool = await get_pg_pool()
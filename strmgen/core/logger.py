@@ -29,6 +29,10 @@ progress_listeners: list[asyncio.Queue[str]] = []
 class AsyncQueueHandler(Handler):
     """Push formatted log records into an asyncio.Queue."""
     def emit(self, record: logging.LogRecord) -> None:
+        # with no /logs client draining the queue it stays full; drop the
+        # record before paying for formatting it
+        if log_queue.full():
+            return
         msg = self.format(record)
         try:
             log_queue.put_nowait(msg)
@@ -1,17 +1,58 @@
 # strmgen/core/models/dispatcharr.py
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from pathlib import Path
 
-from strmgen.core.config import get_settings
+from strmgen.core.config import get_settings, on_settings_reload
 from strmgen.core.string_utils import clean_name, fix_url_string
 from strmgen.core.models.paths import MediaPaths
 from strmgen.core.models.models import StreamInfo
 from strmgen.core.models.enums import MediaType
 from strmgen.core.models.regex import TITLE_YEAR_RE, RE_EPISODE_TAG
 
-@dataclass
+@lru_cache(maxsize=4)
+def _proxy_base(api_base: str, stream_base_url: str) -> str:
+    """URL prefix shared by every proxied stream; built once per settings value."""
+    return f"{api_base.rstrip('/')}/{stream_base_url}/"
+
+
+@lru_cache(maxsize=8192)
+def _parse_title_year(raw_name: str) -> Tuple[str, Optional[int]]:
+    """Cleaned (title, year) for a movie stream name; names repeat across groups and runs."""
+    m = TITLE_YEAR_RE.match(raw_name)
+    if m:
+        return clean_name(m.group("title")), int(m.group("year"))
+    return clean_name(raw_name), None
+
+
+@lru_cache(maxsize=4096)
+def _clean_show_name(raw_show: str) -> str:
+    """Cleaned show name; every episode of a show carries the same raw prefix."""
+    return clean_name(raw_show)
+
+# both depend on remove_strings via clean_name
+on_settings_reload(_parse_title_year.cache_clear)
+on_settings_reload(_clean_show_name.cache_clear)
+
+
+def _parse_updated_at(ts: str) -> Optional[datetime]:
+    """
+    Parse Dispatcharr's ISO-8601 timestamps ("...Z", with or without
+    fractional seconds) as UTC. fromisoformat is C-implemented and accepts
+    the trailing Z on Python 3.11+, unlike the old strptime fallback chain.
+    """
+    try:
+        dt = datetime.fromisoformat(ts)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+@dataclass(slots=True)
 class DispatcharrStream:
     # ── Raw API fields ─────────────────────────────────────────────────────────
     id: int
@@ -42,6 +83,9 @@ class DispatcharrStream:
     poster_path:   Path               = field(init=False, repr=False)
     backdrop_path: Path               = field(init=False, repr=False)
 
+    # ── Lazily filled caches ─────────────────────────────────────────────────
+    _proxy_url:    Optional[str]      = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         info = StreamInfo(
             group   = self.channel_group_name,
@@ -86,11 +130,15 @@ class DispatcharrStream:
 
     @property
     def proxy_url(self) -> str:
-        settings = get_settings()
-        if not self.stream_hash:
-            return self.url
-        url = f"{settings.api_base.rstrip('/')}/{settings.stream_base_url}/{self.stream_hash}"
-        return fix_url_string(url)
+        # read several times per stream (validate, compare, write); build it once
+        if self._proxy_url is None:
+            settings = get_settings()
+            if not self.stream_hash:
+                self._proxy_url = self.url
+            else:
+                url = _proxy_base(settings.api_base, settings.stream_base_url) + self.stream_hash
+                self._proxy_url = fix_url_string(url)
+        return self._proxy_url
 
     @property
     def stream_updated(self) -> bool:
@@ -115,20 +163,14 @@ class DispatcharrStream:
         raw_name = str(data.get("name") or "")
 
         if stream_type is MediaType.MOVIE:
-            m = TITLE_YEAR_RE.match(raw_name)
-            if m:
-                title = clean_name(m.group("title"))
-                year  = int(m.group("year"))
-            else:
-                title = clean_name(raw_name)
-                year  = None
+            title, year = _parse_title_year(raw_name)
             season = episode = None
         else:
             match = RE_EPISODE_TAG.match(raw_name)
             if not match:
                 return None
             raw_show, ss, ee = match.groups()
-            title   = clean_name(raw_show)
+            title   = _clean_show_name(raw_show)
             year    = None
             season  = int(ss)
             episode = int(ee)
@@ -144,15 +186,7 @@ class DispatcharrStream:
         local_file      = Path(str(local_file_val)) if local_file_val else None
 
         ts = data.get("updated_at")
-        updated_at = None
-        if ts:
-            for fmt in ("%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%SZ"):
-                try:
-                    updated_at = datetime.strptime(str(ts), fmt)\
-                                     .replace(tzinfo=timezone.utc)
-                    break
-                except ValueError:
-                    continue
+        updated_at = _parse_updated_at(str(ts)) if ts else None
 
         return cls(
             id                  = int(data["id"]),
@@ -1,4 +1,5 @@
 # strmgen/core/models/paths.py
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
 
@@ -6,6 +7,28 @@ from strmgen.core.config import get_settings
 from strmgen.core.models.models import StreamInfo
 from strmgen.core.models.enums import MediaType
 
+@lru_cache(maxsize=4)
+def _root_path(output_root: str) -> Path:
+    return Path(output_root)
+
+
+@lru_cache(maxsize=4096)
+def _base_folder_path(
+    output_root: str,
+    media_type: MediaType,
+    group: str,
+    title: str,
+    year: Optional[int],
+) -> Path:
+    # every stream asks for the same base folder 4-5 times (strm, nfo, images);
+    # keyed on output_root too, so a settings reload gets fresh paths
+    if media_type is MediaType.MOVIE:
+        folder_name = f"{title} ({year})" if year else title
+    else:
+        folder_name = title
+    return _root_path(output_root) / media_type.value / group / folder_name
+
+
 class MediaPaths:
     """
     Utility for constructing media file paths based on in-memory settings.
@@ -14,7 +37,7 @@ class MediaPaths:
     @classmethod
     def _root(cls) -> Path:
         """Get the configured output root directory from settings."""
-        return Path(get_settings().output_root)
+        return _root_path(get_settings().output_root)
 
     @classmethod
     def _base_folder(
@@ -27,12 +50,7 @@ class MediaPaths:
         """
         Construct the base folder for the given media type, group, title, and optional year.
         """
-        root = cls._root()
-        if media_type is MediaType.MOVIE:
-            folder_name = f"{title} ({year})" if year else title
-        else:
-            folder_name = title
-        return root / media_type.value / group / folder_name
+        return _base_folder_path(get_settings().output_root, media_type, group, title, year)
 
     @classmethod
     def _file_path(
@@ -86,7 +104,8 @@ class MediaPaths:
         assert stream.season is not None, "season required"
         base = cls._base_folder(MediaType.TV, stream.group, stream.title, None)
         season_folder = base / f"Season {stream.season:02d}"
-        season_folder.mkdir(parents=True, exist_ok=True)
+        from strmgen.core.utils import ensure_dir
+        ensure_dir(season_folder)
         return season_folder
 
     @classmethod
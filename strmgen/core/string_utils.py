@@ -1,43 +1,78 @@
 # strmgen/core/string_utils.py
 
 import re
+import string
+from functools import lru_cache
+from typing import Tuple
 from urllib.parse import urlsplit, urlunsplit, quote, parse_qsl, urlencode
 
-from strmgen.core.config import get_settings
+from strmgen.core.config import get_settings, on_settings_reload
+
+# Characters that are illegal in filenames, stripped in a single C-level pass
+_ILLEGAL_TRANS = str.maketrans("", "", '<>:"/\\|?*')
+_MULTI_SLASH = re.compile(r"/{2,}")
+# Path characters that quote(..., safe="/") leaves untouched
+_URL_PATH_SAFE = frozenset(string.ascii_letters + string.digits + "_.-~/")
+# Host/port characters that urlsplit passes through untouched
+_URL_NETLOC_SAFE = frozenset(string.ascii_letters + string.digits + "-._~:@%!$&'()*+,;=")
+_URL_SCHEME = re.compile(r"[a-z][a-z0-9+.-]*")
 
 # ─── Filename Utilities ───────────────────────────────────────────────────────
 
+@lru_cache(maxsize=1)
+def _remove_strings() -> Tuple[str, ...]:
+    """The configured remove_strings, read from settings once per reload."""
+    return tuple(get_settings().remove_strings or ())
+
+on_settings_reload(_remove_strings.cache_clear)
+
+
 def clean_name(name: str) -> str:
     """Sanitize and strip optional tokens from a name, then trim surrounding spaces."""
-    settings = get_settings()
-    if settings.remove_strings:
-        for token in settings.remove_strings:
-            name = name.replace(token, "")
+    # tokens are removed one after another in configured order, so overlapping
+    # tokens (e.g. "HD" before "FHD") keep producing the same folder names
+    for token in _remove_strings():
+        name = name.replace(token, "")
     # remove illegal filesystem characters
-    name = re.sub(r'[<>:"/\\|?*]', "", name)
-    # strip spaces before and after
-    return name.strip()
+    return name.translate(_ILLEGAL_TRANS).strip()
 
 
 def remove_prefixes(title: str) -> str:
     """Remove configured prefixes from a title and strip whitespace."""
-    settings = get_settings()
-    for bad in settings.remove_strings:
+    for bad in _remove_strings():
         title = title.replace(bad, "").strip()
-    return title        
+    return title
 
 
+@lru_cache(maxsize=8192)
 def fix_url_string(raw_url: str) -> str:
     """
     1. Splits into (scheme, netloc, path, query, fragment).
     2. Collapses multiple slashes in the *path* only.
     3. Percent‑encodes the path and query.
     4. Re‑assembles with urlunsplit, preserving 'http://' or 'https://'.
+
+    Already-normalized URLs (lowercase scheme, plain host, no query/fragment,
+    clean path) are returned as-is, and results are cached since the same proxy URL is
+    rebuilt several times per stream.
     """
+    scheme_part, sep, rest = raw_url.partition("://")
+    if sep and _URL_SCHEME.fullmatch(scheme_part):
+        netloc, slash, path = rest.partition("/")
+        # keep the path's leading '/', so a '//' right after the host is seen
+        path = slash + path
+        if (
+            netloc
+            and _URL_NETLOC_SAFE.issuperset(netloc)
+            and "//" not in path
+            and _URL_PATH_SAFE.issuperset(path)
+        ):
+            return raw_url
+
     scheme, netloc, path, query, fragment = urlsplit(raw_url)
 
     # collapse runs of '/' in the *path* to a single '/'
-    normalized_path = re.sub(r'/{2,}', '/', path)
+    normalized_path = _MULTI_SLASH.sub("/", path)
 
     # percent‑encode remaining unsafe characters
     safe_path = quote(normalized_path, safe="/")
@@ -1,17 +1,18 @@
 # strmgen/core/utils.py
 """
-Utility functions: directory handling, Jinja2-backed NFO templating, TMDb filtering, and threshold checks.
+Utility functions: directory handling, NFO rendering (str-formatted tvshow, episode and movie NFOs), TMDb filtering, and threshold checks.
 """
 import errno
 import shutil
 import os
+import asyncio
 import logging
+import threading
 
 from pathlib import Path
-from typing import List, Any, Optional, Dict, Callable, TypeVar, Union
-from jinja2 import Environment, select_autoescape
+from typing import List, Any, Optional, Dict, Callable, Awaitable, Iterator, Set, Tuple, TypeVar, Union
 
-from strmgen.core.config import get_settings
+from strmgen.core.config import get_settings, on_settings_reload
 from strmgen.core.models.dispatcharr import DispatcharrStream
 from strmgen.core.models.tv import TVShow, EpisodeMeta, SeasonMeta
 from strmgen.core.models.movie import Movie
@@ -19,13 +20,6 @@ from strmgen.core.models.movie import Movie
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
-# Initialize Jinja2 environment for XML escaping
-env = Environment(
-    autoescape=select_autoescape(["xml"]),
-    trim_blocks=True,
-    lstrip_blocks=True
-)
-
 # ─── Path Helpers ────────────────────────────────────────────────────────────
 def target_folder(root: Path, category: str, group: str, name: Optional[str]) -> Path:
     """Construct and create target folder path."""
@@ -38,75 +32,123 @@ def target_folder(root: Path, category: str, group: str, name: Optional[str]) ->
 # ─── Conditional Writer ─────────────────────────────────────────────────────
 T = TypeVar("T", Movie, TVShow, EpisodeMeta, SeasonMeta)
 
-def write_if(
+async def write_if(
     cond: bool,
     stream: DispatcharrStream,
     tmdb: T,
-    writer_fn: Callable[[DispatcharrStream, T], None],
+    writer_fn: Callable[[DispatcharrStream, T], Awaitable[bool]],
 ) -> None:
-    """Call writer_fn if cond is True."""
+    """Await writer_fn if cond is True."""
     if cond:
-        writer_fn(stream, tmdb)
-
-# ─── NFO Templates ──────────────────────────────────────────────────────────
-TVSHOW_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
-<tvshow>
-  <title>{{ show.name | e }}</title>
-  <originaltitle>{{ show.original_name | e }}</originaltitle>
-  <plot>{{ show.overview | e }}</plot>
-  <tmdbid>{{ show.id }}</tmdbid>
-  <year>{{ show.first_air_date[:4] if show.first_air_date else '' }}</year>
-  <premiered>{{ show.first_air_date }}</premiered>
-  <rating>{{ show.vote_average }}</rating>
-  <votes>{{ show.vote_count }}</votes>
-  {% for genre in show.genre_ids %}
-  <genre>{{ genre.name | e }}</genre>
-  {% endfor %}
-  <status>{{ show.raw.get('status', '') }}</status>
-  <studio>{{ show.raw.get('networks', [])[0]['name'] if show.raw.get('networks') else '' }}</studio>
-</tvshow>"""
-
-EPISODE_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
-<episodedetails>
-  <title>{{ episode.name | e }}</title>
-  <season>{{ episode.season_number }}</season>
-  <episode>{{ episode.episode_number }}</episode>
-  <plot>{{ episode.overview | e }}</plot>
-  <aired>{{ episode.air_date }}</aired>
-  <rating>{{ episode.vote_average }}</rating>
-  <votes>{{ episode.vote_count }}</votes>
-  <tmdbid>{{ episode.id }}</tmdbid>
-</episodedetails>"""
-
-MOVIE_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
-<movie>
-  <title>{{ movie.title | e }}</title>
-  <originaltitle>{{ movie.original_title | e }}</originaltitle>
-  <sorttitle>{{ movie.title | e }}</sorttitle>
-  <year>{{ movie.release_date[:4] if movie.release_date else '' }}</year>
-  <releasedate>{{ movie.release_date }}</releasedate>
-  <plot>{{ movie.overview | e }}</plot>
-  <runtime>{{ movie.raw.get('runtime', '') }}</runtime>
-  <rating>{{ movie.vote_average }}</rating>
-  <votes>{{ movie.vote_count }}</votes>
-  <tmdbid>{{ movie.id }}</tmdbid>
-  {% for genre in movie.genre_ids %}
-  <genre>{{ genre.name | e }}</genre>
-  {% endfor %}
-  <studio>{{ movie.raw.get('production_companies', [])[0]['name'] if movie.raw.get('production_companies') else '' }}</studio>
-  <country>{{ movie.raw.get('production_countries', [])[0]['name'] if movie.raw.get('production_countries') else '' }}</country>
-  <status>{{ movie.raw.get('status', '') }}</status>
-</movie>"""
+        await writer_fn(stream, tmdb)
+
+# ─── Fast NFO Renderers ─────────────────────────────────────────────────────
+# Plain str.format renderers of the tvshow, episode and movie NFOs. They
+# produce the same bytes the former Jinja templates did (autoescape
+# included); tests/test_nfo_render.py keeps those templates as the reference.
+_XML_TRANS = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&#34;",
+    "'": "&#39;",
+})
+
+
+def _esc(value: Any) -> str:
+    """XML-escape value exactly like Jinja autoescape does."""
+    return str(value).translate(_XML_TRANS)
+
+
+def _first_name(raw: Dict[str, Any], key: str) -> str:
+    items = raw.get(key)
+    return _esc(items[0].get("name", "")) if items else ""
+
+
+def _genre_lines(genres: Any) -> str:
+    lines = []
+    for g in genres or ():
+        name = g.get("name", "") if isinstance(g, dict) else getattr(g, "name", "")
+        lines.append(f"  <genre>{_esc(name)}</genre>\n")
+    return "".join(lines)
+
+
+def render_tvshow_nfo(show: TVShow) -> str:
+    raw = show.raw
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        "<tvshow>\n"
+        f"  <title>{_esc(show.name)}</title>\n"
+        f"  <originaltitle>{_esc(show.original_name)}</originaltitle>\n"
+        f"  <plot>{_esc(show.overview)}</plot>\n"
+        f"  <tmdbid>{_esc(show.id)}</tmdbid>\n"
+        f"  <year>{_esc(show.first_air_date[:4]) if show.first_air_date else ''}</year>\n"
+        f"  <premiered>{_esc(show.first_air_date)}</premiered>\n"
+        f"  <rating>{_esc(show.vote_average)}</rating>\n"
+        f"  <votes>{_esc(show.vote_count)}</votes>\n"
+        f"{_genre_lines(show.genre_ids)}"
+        f"  <status>{_esc(raw.get('status', ''))}</status>\n"
+        f"  <studio>{_first_name(raw, 'networks')}</studio>\n"
+        "</tvshow>"
+    )
+
+
+def render_episode_nfo(episode: EpisodeMeta) -> str:
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        "<episodedetails>\n"
+        f"  <title>{_esc(episode.name)}</title>\n"
+        f"  <season>{_esc(episode.season_number)}</season>\n"
+        f"  <episode>{_esc(episode.episode_number)}</episode>\n"
+        f"  <plot>{_esc(episode.overview)}</plot>\n"
+        f"  <aired>{_esc(episode.air_date)}</aired>\n"
+        f"  <rating>{_esc(episode.vote_average)}</rating>\n"
+        f"  <votes>{_esc(episode.vote_count)}</votes>\n"
+        f"  <tmdbid>{_esc(episode.id)}</tmdbid>\n"
+        "</episodedetails>"
+    )
+
+
+def render_movie_nfo(movie: Movie) -> str:
+    raw = movie.raw
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        "<movie>\n"
+        f"  <title>{_esc(movie.title)}</title>\n"
+        f"  <originaltitle>{_esc(movie.original_title)}</originaltitle>\n"
+        f"  <sorttitle>{_esc(movie.title)}</sorttitle>\n"
+        f"  <year>{_esc(movie.release_date[:4]) if movie.release_date else ''}</year>\n"
+        f"  <releasedate>{_esc(movie.release_date)}</releasedate>\n"
+        f"  <plot>{_esc(movie.overview)}</plot>\n"
+        f"  <runtime>{_esc(raw.get('runtime', ''))}</runtime>\n"
+        f"  <rating>{_esc(movie.vote_average)}</rating>\n"
+        f"  <votes>{_esc(movie.vote_count)}</votes>\n"
+        f"  <tmdbid>{_esc(movie.id)}</tmdbid>\n"
+        f"{_genre_lines(movie.genre_ids)}"
+        f"  <studio>{_first_name(raw, 'production_companies')}</studio>\n"
+        f"  <country>{_first_name(raw, 'production_countries')}</country>\n"
+        f"  <status>{_esc(raw.get('status', ''))}</status>\n"
+        "</movie>"
+    )
 
 # ─── Templating Functions ───────────────────────────────────────────────────
-def write_tvshow_nfo(stream: DispatcharrStream, show: TVShow) -> bool:
+def _write_bytes(path: Path, data: bytes) -> None:
+    ensure_dir(path.parent)
+    path.write_bytes(data)
+
+
+async def _awrite(path: Path, data: bytes) -> None:
+    """Create the parent folder and write data in a single worker-thread hop."""
+    await asyncio.to_thread(_write_bytes, path, data)
+
+
+async def write_tvshow_nfo(stream: DispatcharrStream, show: TVShow) -> bool:
     path = stream.nfo_path
     try:
-        xml = env.from_string(TVSHOW_TEMPLATE).render(stream=stream, show=show)
-        path.parent.mkdir(parents=True, exist_ok=True)
+        xml = render_tvshow_nfo(show)
 
         try:
-            path.write_text(xml, encoding="utf-8")
+            await _awrite(path, xml.encode("utf-8"))
             logger.info("[NFO] ✅ TV-Show NFO: %s", path)
             logger.debug("[NFO] TV-Show NFO content: %s", xml)
             return True
@@ -119,14 +161,13 @@ def write_tvshow_nfo(stream: DispatcharrStream, show: TVShow) -> bool:
         return False
 
 
-def write_episode_nfo(stream: DispatcharrStream, episode: EpisodeMeta) -> bool:
+async def write_episode_nfo(stream: DispatcharrStream, episode: EpisodeMeta) -> bool:
     path = stream.nfo_path
     try:
-        xml = env.from_string(EPISODE_TEMPLATE).render(stream=stream, episode=episode)
-        path.parent.mkdir(parents=True, exist_ok=True)
+        xml = render_episode_nfo(episode)
 
         try:
-            path.write_text(xml, encoding="utf-8")
+            await _awrite(path, xml.encode("utf-8"))
             logger.info("[NFO] ✅ Episode NFO: %s", path)
             logger.debug("[NFO] Episode NFO content: %s", xml)
             return True
@@ -142,14 +183,13 @@ def write_episode_nfo(stream: DispatcharrStream, episode: EpisodeMeta) -> bool:
         return False
 
 
-def write_movie_nfo(stream: DispatcharrStream, movie: Movie) -> bool:
+async def write_movie_nfo(stream: DispatcharrStream, movie: Movie) -> bool:
     path = stream.nfo_path
     try:
-        xml = env.from_string(MOVIE_TEMPLATE).render(stream=stream, movie=movie)
-        path.parent.mkdir(parents=True, exist_ok=True)
+        xml = render_movie_nfo(movie)
 
         try:
-            path.write_text(xml, encoding="utf-8")
+            await _awrite(path, xml.encode("utf-8"))
             logger.info("[NFO] ✅ Movie NFO: %s", path)
             logger.debug("[NFO] Movie NFO content: %s", xml)
             return True
@@ -162,40 +202,89 @@ def write_movie_nfo(stream: DispatcharrStream, movie: Movie) -> bool:
         return False
 
 # ─── TMDb Missing Fields Validators ───────────────────────────────────────────
+# Tuples rather than sets so the reported missing fields keep a stable order.
+_REQUIRED_MOVIE_FIELDS = ('title', 'release_date', 'overview', 'vote_average', 'id')
+_REQUIRED_TV_FIELDS    = ('name', 'season_number', 'episode_number', 'overview', 'id')
+
+
+def _missing_fields(meta: Dict[str, Any], required: Tuple[str, ...]) -> List[str]:
+    # one dict probe per key; empty values (""/0/None) count as missing
+    get = meta.get
+    return [k for k in required if not get(k)]
+
+
 def tmdb_missing_nfo_movie_fields(meta: Dict[str, Any]) -> List[str]:
-    required = ['title', 'release_date', 'overview', 'vote_average', 'id']
-    return [k for k in required if not meta.get(k)]
+    return _missing_fields(meta, _REQUIRED_MOVIE_FIELDS)
 
 
 def tmdb_missing_nfo_tv_fields(meta: Dict[str, Any]) -> List[str]:
-    required = ['name', 'season_number', 'episode_number', 'overview', 'id']
-    return [k for k in required if not meta.get(k)]
+    return _missing_fields(meta, _REQUIRED_TV_FIELDS)
 
 # ─── TMDb Filtering ──────────────────────────────────────────────────────────
 MetaType = Union[Movie, TVShow]
 
 
+# (media class, tmdb id) -> verdict. The checks only depend on the TMDb record
+# and the minimum_* settings, so the cache is dropped whenever settings reload.
+_FILTER_CACHE_MAX = 50_000
+_filter_cache: Dict[Tuple[str, int], bool] = {}
+on_settings_reload(_filter_cache.clear)
+
+
 def filter_by_threshold(name: str, meta: Optional[MetaType]) -> bool:
     if meta is None:
         return True
 
-    # both Movie and TVShow now expose a .year property
-    year = meta.year
+    key = (type(meta).__name__, meta.id)
+    cached = _filter_cache.get(key)
+    if cached is not None:
+        return cached
+
+    passed = _check_thresholds(name, meta)
+    if len(_filter_cache) >= _FILTER_CACHE_MAX:
+        _filter_cache.clear()
+    _filter_cache[key] = passed
+    return passed
+
+
+def _check_thresholds(name: str, meta: MetaType) -> bool:
+    # alias thresholds once; get_settings() also picks up a reloaded config
+    cfg = get_settings()
+    min_rating = cfg.minimum_tmdb_rating
+    min_votes  = cfg.minimum_tmdb_votes
+    min_pop    = cfg.minimum_tmdb_popularity
+    min_year   = cfg.minimum_year
 
+    # only build the descriptive failure list when it will actually be logged
+    verbose = logger.isEnabledFor(logging.INFO)
     failures: list[str] = []
-    for field, value, threshold in (
-        ("rating",     meta.vote_average,  settings.minimum_tmdb_rating),
-        ("votes",      meta.vote_count,    settings.minimum_tmdb_votes),
-        ("popularity", meta.popularity,    settings.minimum_tmdb_popularity),
-    ):
-        if value < threshold:
-            failures.append(f"{field} {value}<{threshold}")
 
-    if year is not None and year < settings.minimum_year:
-        failures.append(f"year {year}<{settings.minimum_year}")
+    # rating first: it rejects the most titles
+    if min_rating is not None and meta.vote_average < min_rating:
+        if not verbose:
+            return False
+        failures.append(f"rating {meta.vote_average}<{min_rating}")
+
+    if min_votes is not None and meta.vote_count < min_votes:
+        if not verbose:
+            return False
+        failures.append(f"votes {meta.vote_count}<{min_votes}")
+
+    if min_pop is not None and meta.popularity < min_pop:
+        if not verbose:
+            return False
+        failures.append(f"popularity {meta.popularity}<{min_pop}")
+
+    # both Movie and TVShow now expose a .year property
+    if min_year is not None:
+        year = meta.year
+        if year is not None and year < min_year:
+            if not verbose:
+                return False
+            failures.append(f"year {year}<{min_year}")
 
     if failures:
-        logger.info(f"[TMDB] ❌ {name} filtered: {', '.join(failures)}")
+        logger.info("[TMDB] ❌ %s filtered: %s", name, ", ".join(failures))
         return False
 
     return True
@@ -203,73 +292,152 @@ def filter_by_threshold(name: str, meta: Optional[MetaType]) -> bool:
 
 
 # ─── Filesystem Helpers ───────────────────────────────────────────────────────
+# folders ensure_dir has created; ensure_dir runs in worker threads too
+_made_dirs: Set[str] = set()
+_made_dirs_lock = threading.Lock()
+
+
+def ensure_dir(path: Path) -> None:
+    """
+    mkdir -p, remembered per process so folders shared by many streams
+    (show, season, group) are only created once. Failures are not cached.
+    """
+    key = str(path)
+    if key in _made_dirs:
+        return
+    Path(key).mkdir(parents=True, exist_ok=True)
+    with _made_dirs_lock:
+        _made_dirs.add(key)
+
+
+def _forget_dir(path: Path) -> None:
+    """Forget path and every folder below it, so they are re-created on next use."""
+    root = str(path)
+    prefix = root.rstrip(os.sep) + os.sep
+    with _made_dirs_lock:
+        _made_dirs.difference_update(
+            [d for d in _made_dirs if d == root or d.startswith(prefix)]
+        )
+
+
+def clear_dir_cache() -> None:
+    """Forget which folders were created; call when folders may have been removed."""
+    with _made_dirs_lock:
+        _made_dirs.clear()
+
+
 def safe_mkdir(path: Path) -> None:
     try:
-        path.mkdir(parents=True, exist_ok=True)
+        ensure_dir(path)
     except Exception:
         logger.exception("Failed mkdir: %s", path)
 
 
+def _walk_post_order(root: str) -> Iterator[Tuple[str, bool]]:
+    """
+    Yield (path, is_dir) for everything under root, children before their
+    parent. Uses the dirent type from scandir, so no extra stat per entry.
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_post_order(entry.path)
+                yield entry.path, True
+            else:
+                yield entry.path, False
+
+
+def _remove_file(path: Path) -> None:
+    """Unlink a file; nothing is left to clean up once unlink succeeds."""
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        return
+    except OSError as e:
+        # Perms: chmod + retry
+        if e.errno in (errno.EACCES, errno.EPERM):
+            try:
+                os.chmod(path, 0o700)
+                return safe_remove(path)
+            except Exception:
+                logger.error("Permission fixup failed for %r", path, exc_info=True)
+        else:
+            logger.error("Unexpected error removing %r: %r", path, e, exc_info=True)
+
+
+def _remove_dir(path: Path) -> None:
+    """rmtree a directory, with stale-handle and permission fallbacks."""
+    try:
+        shutil.rmtree(path)
+    except FileNotFoundError:
+        return
+    except OSError as e:
+        # Handle stale-handle during rmtree
+        if e.errno == errno.ESTALE:
+            logger.warning("Stale handle for %r, forcing removal of contents.", path)
+            # fallback: try to remove children manually then the dir itself
+            try:
+                for child, is_dir in _walk_post_order(str(path)):
+                    try:
+                        if is_dir:
+                            os.rmdir(child)
+                        else:
+                            os.unlink(child)
+                    except OSError:
+                        pass
+                # after clearing children, dir should be empty
+                os.rmdir(str(path))
+            except Exception:
+                logger.error("Manual cleanup failed for %r", path, exc_info=True)
+        # Perms: chmod + retry
+        elif e.errno in (errno.EACCES, errno.EPERM):
+            try:
+                os.chmod(path, 0o700)
+                return safe_remove(path)
+            except Exception:
+                logger.error("Permission fixup failed for %r", path, exc_info=True)
+        else:
+            logger.error("Unexpected error removing %r: %r", path, e, exc_info=True)
+
+    # Ensure the now-empty directory itself is gone
+    if path.exists():
+        try:
+            os.rmdir(str(path))
+        except OSError as e:
+            if e.errno in (errno.ENOENT, errno.ENOTDIR):
+                return
+            # Last resort: recursive in-process removal
+            logger.error("Empty‐dir removal failed for %r: %r, forcing rmtree", path, e, exc_info=True)
+            shutil.rmtree(path, ignore_errors=True)
+            if path.exists():
+                logger.error("Forced removal failed for %r", path)
+
+
 def safe_remove(path: Path):
     """Remove files/dirs without blowing up on NFS stale handles, perms, or symlinks."""
-    # Shortcut: nothing to do
-    if not path.exists() and not path.is_symlink():
-        return
+    # removed folders must be re-created on next use; others stay cached
+    _forget_dir(path)
 
-    # 1) Symlink -> unlink
+    # 1) Symlink -> unlink, never follow it
     if path.is_symlink():
         try:
             path.unlink()
         except FileNotFoundError:
-            return
+            pass
         except OSError as e:
-            logger.warning(f"Error unlinking symlink {path}: {e!r}")
-            # fall through to shell fallback
+            logger.warning("Error unlinking symlink %s: %r", path, e)
+        return
 
-    else:
-        # 2) Try shutil.rmtree for directories, unlink for files
-        try:
-            if path.is_dir():
-                shutil.rmtree(path)
-            else:
-                path.unlink()
-        except FileNotFoundError:
-            return
-        except OSError as e:
-            # Handle stale-handle during rmtree or unlink
-            if e.errno == errno.ESTALE:
-                logger.warning(f"Stale handle for {path!r}, forcing removal of contents.")
-                # fallback: try to remove children manually then the dir itself
-                try:
-                    for child in path.rglob('*'):
-                        try:
-                            if child.is_dir():
-                                child.rmdir()
-                            else:
-                                child.unlink()
-                        except Exception:
-                            pass
-                    # after clearing children, dir should be empty
-                    os.rmdir(str(path))
-                except Exception:
-                    logger.error(f"Manual cleanup failed for {path!r}", exc_info=True)
-            # Perms: chmod + retry
-            elif e.errno in (errno.EACCES, errno.EPERM):
-                try:
-                    os.chmod(path, 0o700)
-                    return safe_remove(path)
-                except Exception:
-                    logger.error(f"Permission fixup failed for {path!r}", exc_info=True)
-            else:
-                logger.error(f"Unexpected error removing {path!r}: {e!r}", exc_info=True)
+    # 2) rmtree for directories, plain unlink for files; one stat decides which
+    if path.is_dir():
+        _remove_dir(path)
+    elif path.exists():
+        _remove_file(path)
 
-    # 3) Ensure the now-empty directory itself is gone
-    if path.exists():
-        try:
-            os.rmdir(str(path))
-        except OSError as e:
-            if e.errno in (errno.ENOENT, errno.ENOTDIR):
-                return
-            # Last resort: rm -rf
-            logger.error(f"Empty‐dir removal failed for {path!r}: {e!r}, shelling out", exc_info=True)
-            os.system(f"rm -rf {shlex.quote(str(path))}")
\ No newline at end of file
+
+def remove_if_exists(path: Path) -> bool:
+    """safe_remove(path) if anything is there; True if it was. Lets callers use one thread hop."""
+    if not (path.exists() or path.is_symlink()):
+        return False
+    safe_remove(path)
+    return True
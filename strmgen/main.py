@@ -1,10 +1,13 @@
 # strmgen/main.py
+import asyncio
+import asyncpg
 import logging
+import os
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from fastapi import FastAPI, APIRouter
-from testcontainers.postgres import PostgresContainer
 from contextlib import asynccontextmanager
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
@@ -14,43 +17,102 @@ from strmgen.api.routers import settings as settings_router
 from strmgen.web_ui.routes import router as ui_router
 from strmgen.core.auth import get_access_token
 from strmgen.pipeline.runner import schedule_on_startup
-from strmgen.core.config import register_startup, get_settings
+from strmgen.core.config import get_settings, Settings
 from strmgen.core.db import close_pg_pool, init_pg_pool
 from strmgen.core.logger import setup_logging
 from strmgen.core.clients import async_client, tmdb_client, tmdb_image_client, emby_client
 
-app = FastAPI(title="STRMGen API & UI", debug=True)
+if TYPE_CHECKING:
+    # testcontainers pulls in docker & friends; only import it when enabled
+    from testcontainers.postgres import PostgresContainer
 
-# Web UI
-app.include_router(ui_router)
-register_startup(app)
+TOKEN_REFRESH_SECONDS = 15 * 60
 
-# Prime the app logger
-setup_logging()
-logger = logging.getLogger(__name__)
-logger.info("Logger initialized, starting application…")
+# Global container reference
+postgres_container: Optional["PostgresContainer"] = None
+
+# Bump when SCHEMA_DDL / the grants change; startup skips both while the
+# database already records this version.
+SCHEMA_VERSION = 1
+
+# skipped_streams table and its lookup index, sent as one simple-query batch
+SCHEMA_DDL = """
+CREATE TABLE IF NOT EXISTS schema_version (
+  v INT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS skipped_streams (
+  tmdb_id        BIGINT   PRIMARY KEY,
+  dispatcharr_id BIGINT   NOT NULL,
+  stream_type    TEXT     NOT NULL,
+  group_name     TEXT     NOT NULL,
+  name           TEXT     NOT NULL,
+  reprocess      BOOLEAN  NOT NULL DEFAULT FALSE
+);
+CREATE INDEX IF NOT EXISTS idx_skipped_dispatcharr
+  ON skipped_streams(dispatcharr_id);
+"""
+
+def _quote_ident(name: str) -> str:
+    """Quote a Postgres identifier (doubling embedded quotes)."""
+    return '"' + name.replace('"', '""') + '"'
+
+def _grant_sql(db_name: str, db_user: str) -> str:
+    # identifiers can't be bind parameters in GRANT; quote them instead of
+    # interpolating raw config values into the DDL
+    db_name, db_user = _quote_ident(db_name), _quote_ident(db_user)
+    return f"""
+    -- allow connecting
+    GRANT CONNECT ON DATABASE {db_name} TO {db_user};
+    -- allow usage of the public schema
+    GRANT USAGE ON SCHEMA public TO {db_user};
+    -- full control over existing tables
+    GRANT ALL PRIVILEGES ON ALL TABLES IN SCHEMA public TO {db_user};
+    -- full control over sequences (if you ever add serial/identity columns)
+    GRANT ALL PRIVILEGES ON ALL SEQUENCES IN SCHEMA public TO {db_user};
+    -- auto-grant privileges on future tables/sequences
+    ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT ALL ON TABLES TO {db_user};
+    ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT ALL ON SEQUENCES TO {db_user};
+    """
+
+async def _schema_is_current(conn: asyncpg.Connection) -> bool:
+    try:
+        return await conn.fetchval("SELECT max(v) FROM schema_version") == SCHEMA_VERSION
+    except asyncpg.UndefinedTableError:
+        return False
 
-# API v1 routers
-api_v1 = APIRouter(prefix="/api/v1", tags=["API"])
-api_v1.include_router(process.router,  prefix="/process")
-api_v1.include_router(schedule.router, prefix="/schedule")
-api_v1.include_router(streams.router,  prefix="/streams")
-api_v1.include_router(logs.router,     prefix="/logs")
-api_v1.include_router(tmdb.router,     prefix="/tmdb")
-api_v1.include_router(skipped.router,  prefix="/skipped")
-api_v1.include_router(settings_router.router, prefix="/settings")
-app.include_router(api_v1)
+async def _init_database(settings: Settings) -> None:
+    # 2) Initialize asyncpg pool
+    await init_pg_pool()
 
-# Static files for the UI
-STATIC_DIR = Path(__file__).parent / "web_ui" / "static"
-app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
+    # 3) Ensure skipped_streams table exists (one query when already migrated)
+    from strmgen.core.db import _pool as pg_pool
+    async with pg_pool.acquire() as conn:
+        if await _schema_is_current(conn):
+            return
 
-@app.get("/favicon.ico")
-def favicon():
-    return FileResponse(STATIC_DIR / "img" / "strmgen_icon.png")
+        await conn.execute(SCHEMA_DDL)
+
+        # 3.a) Grant all the necessary rights to your configured DB user,
+        #      in a single round-trip
+        await conn.execute(_grant_sql(settings.db_name, settings.db_user))
+
+        # 3.b) Only record the version once everything above succeeded
+        await conn.execute(
+            "INSERT INTO schema_version (v) VALUES ($1) ON CONFLICT DO NOTHING",
+            SCHEMA_VERSION,
+        )
+        logger.info("Database schema initialised at version %d", SCHEMA_VERSION)
+
+
+async def _refresh_token_periodically() -> None:
+    """Refresh the Dispatcharr token every 15 minutes until cancelled."""
+    while True:
+        await asyncio.sleep(TOKEN_REFRESH_SECONDS)
+        try:
+            await get_access_token()
+        except Exception:
+            logger.exception("[AUTH] Periodic token refresh failed")
 
-# Global container reference
-postgres_container: Optional[PostgresContainer] = None
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -60,6 +122,7 @@ async def lifespan(app: FastAPI):
     # 1) Optionally launch a PostgreSQL Docker container
     if settings.enable_testcontainers:
         try:
+            from testcontainers.postgres import PostgresContainer
             postgres_container = PostgresContainer(
                 image=settings.testcontainers_image,
                 username=settings.db_user,
@@ -81,55 +144,25 @@ async def lifespan(app: FastAPI):
         # Use the configured database URL
         settings.postgres_dsn = settings.database_url
 
-    # 2) Initialize asyncpg pool
-    await init_pg_pool()
-
-    # 3) Ensure skipped_streams table exists
-    from strmgen.core.db import _pool as pg_pool
-    async with pg_pool.acquire() as conn:
-        await conn.execute("""
-        CREATE TABLE IF NOT EXISTS skipped_streams (
-          tmdb_id        BIGINT   PRIMARY KEY,
-          dispatcharr_id BIGINT   NOT NULL,
-          stream_type    TEXT     NOT NULL,
-          group_name     TEXT     NOT NULL,
-          name           TEXT     NOT NULL,
-          reprocess      BOOLEAN  NOT NULL DEFAULT FALSE
-        );
-        """)
-        await conn.execute("""
-        CREATE INDEX IF NOT EXISTS idx_skipped_dispatcharr
-          ON skipped_streams(dispatcharr_id);
-        """)
-
-        # 3.a) Grant all the necessary rights to your configured DB user
-        db_user = settings.db_user
-        db_name = settings.db_name
-
-        # allow connecting
-        await conn.execute(f"GRANT CONNECT ON DATABASE {db_name} TO {db_user};")
-        # allow usage of the public schema
-        await conn.execute(f"GRANT USAGE ON SCHEMA public TO {db_user};")
-        # full control over existing tables
-        await conn.execute(f"GRANT ALL PRIVILEGES ON ALL TABLES IN SCHEMA public TO {db_user};")
-        # full control over sequences (if you ever add serial/identity columns)
-        await conn.execute(f"GRANT ALL PRIVILEGES ON ALL SEQUENCES IN SCHEMA public TO {db_user};")
-        # optional—if you want to auto-grant privileges on future tables/sequences:
-        await conn.execute(f"ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT ALL ON TABLES TO {db_user};")
-        await conn.execute(f"ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT ALL ON SEQUENCES TO {db_user};")
-
-
-
-
+    # 2-3) Set up the database while the Dispatcharr token is fetched;
+    #      the two don't depend on each other
+    token_task = asyncio.create_task(get_access_token())
+    try:
+        await _init_database(settings)
+    except BaseException:
+        token_task.cancel()
+        raise
 
     # 4) Start scheduler, auth, and TMDb genre map
     schedule_on_startup()
-    await get_access_token()
+    await token_task
+    refresh_task = asyncio.create_task(_refresh_token_periodically())
     # await init_tv_genre_map()
 
     try:
         yield
     finally:
+        refresh_task.cancel()
         # Shutdown: close DB pool, HTTP clients, scheduler, and test container
         await close_pg_pool()
         if postgres_container:
@@ -146,7 +179,39 @@ async def lifespan(app: FastAPI):
         await tmdb_image_client.aclose()
         await async_client.aclose()
         await emby_client.aclose()
-        await close_pg_pool()
 
-# Attach the lifespan to the app
-app.router.lifespan_context = lifespan
\ No newline at end of file
+
+app = FastAPI(title="STRMGen API & UI", debug=True, lifespan=lifespan)
+
+# Web UI
+app.include_router(ui_router)
+
+# Prime the app logger
+setup_logging()
+logger = logging.getLogger(__name__)
+logger.info("Logger initialized, starting application…")
+
+# API v1 routers
+api_v1 = APIRouter(prefix="/api/v1", tags=["API"])
+api_v1.include_router(process.router,  prefix="/process")
+api_v1.include_router(schedule.router, prefix="/schedule")
+api_v1.include_router(streams.router,  prefix="/streams")
+api_v1.include_router(logs.router,     prefix="/logs")
+api_v1.include_router(tmdb.router,     prefix="/tmdb")
+api_v1.include_router(skipped.router,  prefix="/skipped")
+api_v1.include_router(settings_router.router, prefix="/settings")
+app.include_router(api_v1)
+
+# Static files for the UI
+STATIC_DIR = Path(__file__).parent / "web_ui" / "static"
+FAVICON_PATH = STATIC_DIR / "img" / "strmgen_icon.png"
+app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
+
+@lru_cache(maxsize=1)
+def _favicon_stat() -> os.stat_result:
+    # bundled asset: stat it once instead of on every request
+    return os.stat(FAVICON_PATH)
+
+@app.get("/favicon.ico")
+def favicon():
+    return FileResponse(FAVICON_PATH, stat_result=_favicon_stat())
@@ -2,26 +2,33 @@
 
 import asyncio
 import logging
+import os
 import fnmatch
-import logging
+import re
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+from functools import lru_cache
 from datetime import datetime, timezone
+from typing import Callable
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.events import EVENT_JOB_EXECUTED, JobExecutionEvent
-from more_itertools import chunked
 
 from strmgen.core.config import get_settings
 from strmgen.core.auth import get_auth_headers
-from strmgen.services.streams import fetch_streams_by_group_name
+from strmgen.services.streams import iter_streams_by_group_name
 from strmgen.services.service_24_7 import process_24_7
 from strmgen.services.movies import process_movies, movie_cache
-from strmgen.services.tv import process_tv
+from strmgen.services.tv import process_tv_stream, reset_tv_run_state
+from strmgen.services.tmdb import clear_tmdb_cache
 from strmgen.core.logger import notify_progress
 from strmgen.core.models.enums import MediaType
 from strmgen.core.clients import async_client
 from strmgen.core.control import set_processor_task, is_running
+from strmgen.core.db import clear_skip_prefetch, flush_skipped
+from strmgen.core.utils import clear_dir_cache
 
 logger = logging.getLogger(__name__)
 
@@ -34,15 +41,86 @@ def _record_daily_run(event: JobExecutionEvent) -> None:
         now = datetime.now(timezone.utc)
         schedule_history["daily_run"] = now
 
+# ─── Group matching ──────────────────────────────────────────────────────────
+_GLOB_SPECIAL = frozenset("*?[")
+
+@lru_cache(maxsize=16)
+def _compile_patterns(patterns: tuple[str, ...]) -> Callable[[str], bool] | None:
+    """
+    Build one matcher for a route's glob patterns (None if empty); cached
+    across runs. Plain names, ``X*``, ``*X`` and ``*X*`` globs become set
+    membership and C-level str methods; anything else falls back to a
+    single fnmatch.translate alternation.
+    """
+    if not patterns:
+        return None
+    literals: set[str] = set()
+    prefixes: list[str] = []
+    suffixes: list[str] = []
+    substrings: list[str] = []
+    complex_: list[str] = []
+    for pat in patterns:
+        core = pat.strip("*")
+        if _GLOB_SPECIAL.intersection(core):
+            complex_.append(pat)
+        elif pat.startswith("*") and pat.endswith("*"):
+            substrings.append(core)
+        elif pat.endswith("*"):
+            prefixes.append(core)
+        elif pat.startswith("*"):
+            suffixes.append(core)
+        else:
+            literals.add(pat)
+
+    lits = frozenset(literals)
+    pre, suf, subs = tuple(prefixes), tuple(suffixes), tuple(substrings)
+    regex = re.compile("|".join(fnmatch.translate(p) for p in complex_)) if complex_ else None
+    rx_match = regex.match if regex is not None else None
+
+    def match(group: str) -> bool:
+        return (
+            group in lits
+            or group.startswith(pre)
+            or group.endswith(suf)
+            or any(sub in group for sub in subs)
+            or (rx_match is not None and rx_match(group) is not None)
+        )
+    return match
+
+
+def _classify_groups(
+    groups: list[str], routes: list[tuple[bool, list[str] | None]]
+) -> list[list[str]]:
+    """
+    Match every group against each enabled route's compiled pattern in a
+    single pass. A group may land in more than one route, as before.
+    """
+    matched: list[list[str]] = [[] for _ in routes]
+    active = []
+    for (enabled, patterns), out in zip(routes, matched):
+        match = _compile_patterns(tuple(patterns or ())) if enabled else None
+        if match is not None:
+            active.append((match, out))
+    for g in groups:
+        for match, out in active:
+            if match(g):
+                out.append(g)
+    return matched
+
+
 # ─── Background‐task control ────────────────────────────────────────────────
 processor_task: asyncio.Task | None = None
 MAIN_LOOP: asyncio.AbstractEventLoop | None = None
 
-def start_background_run():
-    global processor_task, MAIN_LOOP
-    if MAIN_LOOP is None or not MAIN_LOOP.is_running():
-        logger.error("Event loop not ready—cannot start pipeline")
-        return
+def _on_main_loop() -> bool:
+    try:
+        return asyncio.get_running_loop() is MAIN_LOOP
+    except RuntimeError:
+        return False
+
+def _start_pipeline_task() -> None:
+    # always runs on MAIN_LOOP's thread
+    global processor_task
     if processor_task and not processor_task.done():
         logger.info("Scheduled run skipped: pipeline already running")
         return
@@ -50,18 +128,103 @@ def start_background_run():
     set_processor_task(processor_task)
     logger.info("Pipeline background task scheduled")
 
+def start_background_run():
+    """
+    Start the pipeline on the main event loop. Safe to call from worker
+    threads (APScheduler jobs, sync BackgroundTasks): creation is handed to
+    the loop with call_soon_threadsafe instead of touching it cross-thread.
+    """
+    if MAIN_LOOP is None or not MAIN_LOOP.is_running():
+        logger.error("Event loop not ready—cannot start pipeline")
+        return
+    if _on_main_loop():
+        _start_pipeline_task()
+    else:
+        MAIN_LOOP.call_soon_threadsafe(_start_pipeline_task)
+
 def stop_background_run() -> bool:
-    global processor_task
-    if processor_task and not processor_task.done():
-        processor_task.cancel()
+    task = processor_task
+    if task and not task.done():
+        if _on_main_loop():
+            task.cancel()
+        else:
+            MAIN_LOOP.call_soon_threadsafe(task.cancel)
         logger.info("Stop signal sent to pipeline task")
         return True
     return False
 
 # ─── Core async pipeline ────────────────────────────────────────────────────
+async def process_category(groups, proc_fn, media_type, workers):
+    """Process one category's groups in turn, each through a bounded worker pool."""
+    for grp in groups:
+        if not is_running():
+            return
+        try:
+            # 24/7 channels are never recorded as skipped, so only movies and
+            # TV load each page's skip state up front
+            prefetch = media_type is not MediaType.STREAM_24_7
+            async with aclosing(
+                iter_streams_by_group_name(grp, media_type, prefetch_skips=prefetch)
+            ) as streams:
+                await _run_group(streams, grp, proc_fn, media_type, workers)
+            # persist this group's skip decisions before starting the next
+            await flush_skipped()
+        except Exception:
+            # one bad group must not cancel the sibling categories
+            logger.exception("Fatal error in %s group %r; continuing", media_type, grp)
+            continue
+        if not is_running():
+            logger.info("Pipeline stopped during group %s", grp)
+            return
+        logger.info("[PIPELINE] ✅ Completed processing %s streams for group: %s", media_type, grp)
+    if proc_fn == process_movies:
+        movie_cache.clear()
+
+async def _run_group(streams, grp, proc_fn, media_type, workers):
+    # N long-lived workers drain one bounded queue, so a slow stream only
+    # holds up its own worker instead of the whole batch behind it.
+    # Streams are queued page by page as Dispatcharr returns them, so
+    # the progress total grows until the last page has arrived.
+    queue: asyncio.Queue = asyncio.Queue(maxsize=workers * 2)
+    total = 0
+    done = 0
+
+    async def _worker():
+        nonlocal done
+        while True:
+            stream = await queue.get()
+            try:
+                if stream is None:
+                    return
+                if is_running():
+                    await proc_fn(stream, grp)
+            except Exception:
+                logger.exception("Stream %s failed for %s", stream.name, grp)
+            finally:
+                queue.task_done()
+            done += 1
+            notify_progress(media_type=media_type, group=grp, current=done, total=total)
+
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(workers):
+            tg.create_task(_worker())
+        async for stream in streams:
+            if not is_running():
+                break
+            total += 1
+            await queue.put(stream)
+        # one sentinel per worker; TaskGroup exit waits for them to drain
+        for _ in range(workers):
+            await queue.put(None)
+
 async def run_pipeline():
     settings = get_settings()
     logger.info("Pipeline starting")
+    # folders may have been removed on disk since the last run
+    clear_dir_cache()
+    clear_tmdb_cache()
+    reset_tv_run_state()
+    clear_skip_prefetch()
     try:
         headers = await get_auth_headers()
 
@@ -79,93 +242,39 @@ async def run_pipeline():
             logger.exception("Failed to fetch groups, aborting")
             return
 
-        # 2) Filter groups by configured patterns
-        if settings.process_groups_24_7:
-            matched_24_7 = [
-                g for g in all_groups
-                if any(fnmatch.fnmatch(g, pat) for pat in settings.groups_24_7)
-            ]
-        else:
-            matched_24_7 = []
-        if settings.process_tv_series_groups:
-            matched_tv = [
-                g for g in all_groups
-                if any(fnmatch.fnmatch(g, pat) for pat in settings.tv_series_groups)
-            ]
-        else:
-            matched_tv = []
-        if settings.process_movies_groups:
-            matched_movies = [
-                g for g in all_groups
-                if any(fnmatch.fnmatch(g, pat) for pat in settings.movies_groups)
-            ]
-        else:
-            matched_movies = []
+        # 2) Filter groups by configured patterns (one cached matcher per route)
+        matched_24_7, matched_tv, matched_movies = _classify_groups(all_groups, [
+            (settings.process_groups_24_7,      settings.groups_24_7),
+            (settings.process_tv_series_groups, settings.tv_series_groups),
+            (settings.process_movies_groups,    settings.movies_groups),
+        ])
 
-        logger.info(f"Matched 24/7 groups ({len(matched_24_7)}), TV groups ({len(matched_tv)}), Movie groups ({len(matched_movies)})")
+        logger.info("Matched 24/7 groups (%s), TV groups (%s), Movie groups (%s)", len(matched_24_7), len(matched_tv), len(matched_movies))
         if not (matched_24_7 or matched_tv or matched_movies):
             logger.info("No groups matched; pipeline will not run")
             return
 
-        # Helper to process one category of groups
-        async def process_category(groups, proc_fn, media_type):
-            for grp in groups:
-                if not is_running():
-                    return
-                streams = await fetch_streams_by_group_name(grp, media_type)
-                batches = list(chunked(streams, settings.batch_size))
-                for idx, batch in enumerate(batches, start=1):
-                    logger.info("Starting batch %d/%d for group %s", idx, len(batches), grp)
-                    await _process_batch(batch, grp, proc_fn)
-                    if not is_running():
-                        logger.info("Pipeline stopped during batch %d", idx)
-                        return
-                    await asyncio.sleep(settings.batch_delay_seconds)
-                    notify_progress(
-                        media_type=media_type,
-                        group=grp,
-                        current=idx,
-                        total=len(batches),
-                    )
-                logger.info(f"[PIPELINE] ✅ Completed processing {media_type} streams for group: {grp}")
-            if proc_fn == process_movies:
-                movie_cache.clear()
-
-        async def _process_batch(batch, grp, proc_fn):
-            sem = asyncio.Semaphore(settings.concurrent_requests)
-            async def worker(i, total, stream):
-                async with sem:
-                    if not is_running():
-                        return
-                    try:
-                        await proc_fn([stream], grp, headers)
-                    except Exception:
-                        logger.exception("Stream %r failed in batch %d/%d for %s", stream, i, total, grp)
-            total = len(batch)
-            await asyncio.gather(*(worker(i, total, s) for i, s in enumerate(batch, start=1)))
-
-        # 3) Run categories
-        if matched_24_7:
-            await process_category(matched_24_7, process_24_7, MediaType.STREAM_24_7)
-        if matched_movies:
-            await process_category(matched_movies, process_movies, MediaType.MOVIE)
-
-        if matched_tv:
-            for grp in matched_tv:
-                if not is_running():
-                    break
-                streams = await fetch_streams_by_group_name(grp, MediaType.TV)
-                logger.info("TV group %r has %d streams; delegating to process_tv()", grp, len(streams))
-                try:
-                    await process_tv(streams, grp)
-                except Exception:
-                    logger.exception("Fatal error in TV group %r; continuing", grp)
+        workers = max(1, settings.concurrent_requests)
+
+        # 3) Run categories side by side; they write to separate folders and
+        #    only share the HTTP pools, so one category's waits overlap another's
+        async with asyncio.TaskGroup() as tg:
+            if matched_24_7:
+                tg.create_task(process_category(matched_24_7, process_24_7, MediaType.STREAM_24_7, workers))
+            if matched_movies:
+                tg.create_task(process_category(matched_movies, process_movies, MediaType.MOVIE, workers))
+            if matched_tv:
+                tg.create_task(process_category(matched_tv, process_tv_stream, MediaType.TV, workers))
 
     except asyncio.CancelledError:
         logger.info("Pipeline task was cancelled")
     except Exception:
         logger.exception("Pipeline aborted due to unexpected error")
     finally:
+        try:
+            await flush_skipped()
+        except Exception:
+            logger.exception("Failed to flush skipped streams")
         if processor_task and processor_task.cancelled():
             logger.info("Pipeline was cancelled")
         else:
@@ -176,6 +285,14 @@ def schedule_on_startup():
     global MAIN_LOOP
     settings = get_settings()
     MAIN_LOOP = asyncio.get_running_loop()
+    # every pipeline worker hops to a thread for file I/O, and the 24/7,
+    # movie and TV categories each run their own worker pool side by side;
+    # make sure the default executor is never narrower than all of them
+    pipeline_workers = max(1, settings.concurrent_requests) * len(MediaType)
+    MAIN_LOOP.set_default_executor(ThreadPoolExecutor(
+        max_workers=max(pipeline_workers, min(32, (os.cpu_count() or 1) + 4)),
+        thread_name_prefix="strmgen-io",
+    ))
     scheduler.start()
     if settings.enable_scheduled_task:
         trigger = CronTrigger(
@@ -198,10 +315,14 @@ def schedule_on_startup():
         logger.info("Scheduled task disabled")
 
 # ─── CLI entrypoint for ad‑hoc runs ─────────────────────────────────────────
-def main():
+async def _serve_forever():
+    # schedule_on_startup() needs a running loop to capture as MAIN_LOOP
     schedule_on_startup()
     start_background_run()
-    asyncio.get_event_loop().run_forever()
+    await asyncio.Event().wait()
+
+def main():
+    asyncio.run(_serve_forever())
 
 if __name__ == "__main__":
     logging.basicConfig(
@@ -1,11 +1,12 @@
 # strmgen/services/emby.py
 import asyncio
 import httpx
+import time
 import urllib.parse
 from typing import Any
 
 from strmgen.core.clients import emby_client
-from strmgen.core.config import get_settings
+from strmgen.core.config import get_settings, on_settings_reload
 from strmgen.core.logger import logging
 
 settings = get_settings()
@@ -21,11 +22,20 @@ MEDIA_TYPE_MAP = {0: "Movie", 1: "Series"}
 
 from strmgen.core.config import get_settings
 
+# Search results by (normalized title, media type), with the time they were
+# fetched. Every movie in a run asks Emby once; repeats within the TTL (other
+# groups, reprocess clicks) are answered from memory.
+_EMBY_TTL = 3600.0
+_search_cache: dict[tuple[str, str], tuple[float, dict[str, Any] | None]] = {}
+_SEARCH_CACHE_MAX = 50_000
+
+# library contents (or the library id) may differ after a config edit
+on_settings_reload(_search_cache.clear)
+
+
 async def search_emby_library(title: str, media_type: str | int | MediaType) -> dict[str, Any] | None:
     """Search Emby for a given title (movie/show)."""
     try:
-        settings = get_settings()
-
         # Normalize media_type to string
         if isinstance(media_type, MediaType):
             media_type = media_type.value
@@ -37,6 +47,29 @@ async def search_emby_library(title: str, media_type: str | int | MediaType) ->
             media_type = media_type.capitalize()
         else:
             raise ValueError(f"Unsupported media_type: {media_type}")
+    except ValueError as e:
+        logging.warning("[Emby] Unexpected error: %s", e)
+        return None
+
+    key = (normalize_title(title), media_type)
+    hit = _search_cache.get(key)
+    now = time.monotonic()
+    if hit is not None and now - hit[0] < _EMBY_TTL:
+        return hit[1]
+
+    found, ok = await _search_emby(title, media_type)
+    if ok:
+        # only successful answers are cached; errors are retried next time
+        if len(_search_cache) >= _SEARCH_CACHE_MAX:
+            _search_cache.clear()
+        _search_cache[key] = (now, found)
+    return found
+
+
+async def _search_emby(title: str, media_type: str) -> tuple[dict[str, Any] | None, bool]:
+    """One Emby /Items search; returns (match, whether Emby answered)."""
+    try:
+        settings = get_settings()
 
         encoded = urllib.parse.quote(title)
         query = f"/Items?SearchTerm={encoded}&IncludeItemTypes={media_type}&Recursive=true"
@@ -50,15 +83,87 @@ async def search_emby_library(title: str, media_type: str | int | MediaType) ->
         resp.raise_for_status()
         data = resp.json()
 
+        wanted = normalize_title(title)
         for item in data.get("Items", []):
-            if normalize_title(item.get("Name", "")) == normalize_title(title):
-                return item
+            if normalize_title(item.get("Name", "")) == wanted:
+                return item, True
+        return None, True
     except httpx.HTTPError as e:
         logging.warning("[Emby] Search failed: %s", e)
     except Exception as e:
         logging.warning("[Emby] Unexpected error: %s", e)
 
-    return None
+    return None, False
+
+
+# Whole-library movie index: one paged /Items dump replaces a search per
+# movie. Kept as the loading Task so concurrent workers share one load.
+_MOVIE_INDEX_PAGE = 2000
+_movie_index: tuple[float, "asyncio.Task[dict[str, dict[str, Any]] | None]"] | None = None
+
+
+def _reset_movie_index() -> None:
+    global _movie_index
+    _movie_index = None
+
+on_settings_reload(_reset_movie_index)
+
+
+async def _load_emby_movie_index() -> dict[str, dict[str, Any]] | None:
+    """Page through every Emby movie, keyed by normalized name (None on failure)."""
+    settings = get_settings()
+    params: dict[str, Any] = {
+        "IncludeItemTypes": "Movie",
+        "Recursive": "true",
+        "Fields": "ProductionYear",
+        "Limit": _MOVIE_INDEX_PAGE,
+    }
+    if settings.emby_movie_library_id:
+        params["ParentId"] = settings.emby_movie_library_id
+
+    index: dict[str, dict[str, Any]] = {}
+    start = 0
+    try:
+        while True:
+            resp = await emby_client.get("/Items", params={**params, "StartIndex": start})
+            resp.raise_for_status()
+            data = resp.json()
+            items = data.get("Items", [])
+            for item in items:
+                index.setdefault(normalize_title(item.get("Name", "")), item)
+            start += len(items)
+            if not items or start >= data.get("TotalRecordCount", 0):
+                break
+    except httpx.HTTPError as e:
+        logging.warning("[Emby] Movie index failed: %s", e)
+        return None
+    except Exception as e:
+        logging.warning("[Emby] Unexpected error building movie index: %s", e)
+        return None
+
+    logging.info("[Emby] Indexed %d movies", len(index))
+    return index
+
+
+async def find_emby_movie(title: str) -> dict[str, Any] | None:
+    """
+    Look a movie title up in the Emby library index, loading it at most once
+    per _EMBY_TTL. Falls back to the per-title search if the index couldn't
+    be built.
+    """
+    global _movie_index
+    now = time.monotonic()
+    if (
+        _movie_index is None
+        or now - _movie_index[0] >= _EMBY_TTL
+        or _movie_index[1].cancelled()
+    ):
+        _movie_index = (now, asyncio.ensure_future(_load_emby_movie_index()))
+    index = await asyncio.shield(_movie_index[1])
+    if index is None:
+        # a failed load is kept until the TTL too, so workers don't all retry it
+        return await search_emby_library(title, "movie")
+    return index.get(normalize_title(title))
 
 
 async def trigger_emby_rescan(item_id: str) -> None:
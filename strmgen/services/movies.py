@@ -3,18 +3,15 @@
 import asyncio
 import logging
 
-from typing import List
-
 from strmgen.core.config import get_settings
 from .subtitles import download_movie_subtitles
 from .streams import write_strm_file, get_dispatcharr_stream_by_id
 from .tmdb import fetch_movie_details, download_if_missing
-from strmgen.core.utils import write_if, write_movie_nfo, filter_by_threshold, safe_remove
-from strmgen.core.db import mark_skipped, is_skipped, SkippedStream
+from strmgen.core.utils import write_if, write_movie_nfo, filter_by_threshold, remove_if_exists
+from strmgen.core.db import queue_skipped, flush_skipped, is_skipped, SkippedStream
 from strmgen.core.control import is_running
 from strmgen.core.models.dispatcharr import DispatcharrStream
-from strmgen.services.emby import search_emby_library
-from strmgen.core.models.enums import MediaType
+from strmgen.services.emby import find_emby_movie
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -24,120 +21,111 @@ LOG_TAG = "[MOVIE] 🖼️"
 movie_cache = {}
 
 async def process_movies(
-    streams: List[DispatcharrStream],
+    stream: DispatcharrStream,
     group: str,
     reprocess: bool = False
 ) -> None:
     """
-    Process movie streams:
+    Process one movie stream:
       1) TMDb lookup + threshold filtering
       2) Write .strm and .nfo
       3) Download artwork and subtitles asynchronously
+    The pipeline runner bounds concurrency and handles per-stream errors.
     """
     settings = get_settings()
-    sem = asyncio.Semaphore(settings.concurrent_requests)
-
-    async def _process_one(stream: DispatcharrStream):
-        if not is_running():
-            return
-
-        async with sem:
-            if not is_running():
-                return
-
-            # Skip if already processed
-            if not reprocess and await is_skipped(stream.stream_type.name, stream.id):
-                logger.info(f"{LOG_TAG} 🚫 Skipped: {stream.name}")
-                return
-
-            title = stream.name
-            year = stream.year
-            logger.info(f"{LOG_TAG} 🎬 Processing movie: {title}")
-
-            # Check movie_cache
-            if stream.base_path.name in movie_cache:
-                logger.info(f"{LOG_TAG} 🚫 Skipping duplicate (cache): {title}")
-                if stream.base_path.exists():
-                    await asyncio.to_thread(safe_remove, stream.base_path)
-                    logger.info(f"{LOG_TAG} ✂️ Removed path due to duplicate: {stream.base_path}")
-                await mark_skipped("MOVIE", group, {"title": title, "year": year}, stream)
-                return
-
-            # 1) Fetch TMDb metadata
-            movie = await fetch_movie_details(title=title, year=year)
-            if not is_running() or not movie:
-                logger.info(f"{LOG_TAG} 🚫 '{title}' not found in TMDb")
-                return
-
-            # Fill missing year
-            if not stream.year and movie.release_date:
-                stream.year = int(movie.release_date[:4])
-                stream._recompute_paths()
-
-            # 2) Threshold filtering
-            ok = await asyncio.to_thread(filter_by_threshold, stream.name, movie)
-            if not is_running() or not ok:
-                try:
-                    await mark_skipped("MOVIE", group, movie, stream)
-                    logger.info(f"{LOG_TAG} 🚫 Filter failed: {title}")
-                    if stream.base_path.exists():
-                        await asyncio.to_thread(safe_remove, stream.base_path)
-                        logger.info(f"{LOG_TAG} ✂️ Removed path: {stream.base_path}")
-                except Exception as e:
-                    logger.info(f"{LOG_TAG} Exception occurred: {e}")
-                return
-
-            # check Emby first
-            if settings.emby_api_key and await search_emby_library(movie.title, MediaType.MOVIE):
-                logger.info(f"{LOG_TAG} 🚫 Already in Emby: {movie.title} ({movie.year})")
-                if stream.base_path.exists():
-                    await asyncio.to_thread(safe_remove, stream.base_path)
-                    logger.info(f"{LOG_TAG} ✂️ Removed path: {stream.base_path}")
-                await mark_skipped("MOVIE", group, movie, stream)
-                return
-
-
-            # 3) Write .strm
-            wrote = await write_strm_file(stream)
-            if not is_running() or not wrote:
-                logger.warning(f"{LOG_TAG} ❌ .strm write failed: {stream.strm_path}")
-                return
-
-            # 4) Write NFO and schedule artwork downloads
-            if settings.write_nfo:
-                await asyncio.to_thread(write_if, True, stream, movie, write_movie_nfo)
-                asyncio.create_task(download_if_missing(LOG_TAG, stream, movie))
-
-            # 5) Schedule subtitles
-            if settings.opensubtitles_download:
-                logger.info(f"{LOG_TAG} 🔽 Downloading subtitles for: {title}")
-                asyncio.create_task(download_movie_subtitles(movie, stream))
-
-            # ✅ Add to movie_cache
-            movie_cache[stream.base_path.name] = True
-
-    await asyncio.gather(*(_process_one(s) for s in streams))
+    if not is_running():
+        return
+
+    # Skip if already processed
+    if not reprocess and await is_skipped(stream.stream_type.name, stream.id):
+        logger.info("%s 🚫 Skipped: %s", LOG_TAG, stream.name)
+        return
+
+    title = stream.name
+    year = stream.year
+    logger.info("%s 🎬 Processing movie: %s", LOG_TAG, title)
+
+    # Check movie_cache
+    if stream.base_path.name in movie_cache:
+        logger.info("%s 🚫 Skipping duplicate (cache): %s", LOG_TAG, title)
+        if await asyncio.to_thread(remove_if_exists, stream.base_path):
+            logger.info("%s ✂️ Removed path due to duplicate: %s", LOG_TAG, stream.base_path)
+        await queue_skipped("MOVIE", group, {"title": title, "year": year}, stream)
+        return
+
+    # 1) Fetch TMDb metadata
+    movie = await fetch_movie_details(title=title, year=year)
+    if not is_running() or not movie:
+        logger.info("%s 🚫 '%s' not found in TMDb", LOG_TAG, title)
+        return
+
+    # Fill missing year
+    if not stream.year and movie.release_date:
+        stream.year = int(movie.release_date[:4])
+        stream._recompute_paths()
+
+    # 2) Threshold filtering
+    # memoized per TMDb id and pure CPU: cheaper inline than a thread hop
+    ok = filter_by_threshold(stream.name, movie)
+    if not is_running() or not ok:
+        try:
+            await queue_skipped("MOVIE", group, movie, stream)
+            logger.info("%s 🚫 Filter failed: %s", LOG_TAG, title)
+            if await asyncio.to_thread(remove_if_exists, stream.base_path):
+                logger.info("%s ✂️ Removed path: %s", LOG_TAG, stream.base_path)
+        except Exception as e:
+            logger.info("%s Exception occurred: %s", LOG_TAG, e)
+        return
+
+    # check Emby first
+    if settings.emby_api_key and await find_emby_movie(movie.title):
+        logger.info("%s 🚫 Already in Emby: %s (%s)", LOG_TAG, movie.title, movie.year)
+        if await asyncio.to_thread(remove_if_exists, stream.base_path):
+            logger.info("%s ✂️ Removed path: %s", LOG_TAG, stream.base_path)
+        await queue_skipped("MOVIE", group, movie, stream)
+        return
+
+
+    # 3) Write .strm
+    wrote = await write_strm_file(stream)
+    if not is_running() or not wrote:
+        logger.warning("%s ❌ .strm write failed: %s", LOG_TAG, stream.strm_path)
+        return
+
+    # 4) Write NFO and schedule artwork downloads
+    if settings.write_nfo:
+        await write_if(True, stream, movie, write_movie_nfo)
+        asyncio.create_task(download_if_missing(LOG_TAG, stream, movie))
+
+    # 5) Schedule subtitles
+    if settings.opensubtitles_download:
+        logger.info("%s 🔽 Downloading subtitles for: %s", LOG_TAG, title)
+        asyncio.create_task(download_movie_subtitles(movie, stream))
+
+    # ✅ Add to movie_cache
+    movie_cache[stream.base_path.name] = True
 
 
 async def reprocess_movie(skipped: SkippedStream) -> bool:
     try:
         did = skipped.get("dispatcharr_id")
         if not did:
-            logger.error(f"{LOG_TAG} Invalid dispatcharr_id for: {skipped.get('name')}")
+            logger.error("%s Invalid dispatcharr_id for: %s", LOG_TAG, skipped.get('name'))
             return False
 
         stream = await get_dispatcharr_stream_by_id(did)
         if not is_running() or not stream:
-            logger.error(f"{LOG_TAG} No stream for reprocess: {skipped.get('name')}")
+            logger.error("%s No stream for reprocess: %s", LOG_TAG, skipped.get('name'))
             return False
     except Exception as e:
-        logger.error(f"{LOG_TAG} Error fetching stream: {e}")
+        logger.error("%s Error fetching stream: %s", LOG_TAG, e)
         return False
 
     try:
-        await process_movies([stream], skipped.get("group", ""), reprocess=True)
-        logger.info(f"{LOG_TAG} ✅ Reprocessed movie: {skipped.get('name')}")
+        await process_movies(stream, skipped.get("group", ""), reprocess=True)
+        await flush_skipped()
+        logger.info("%s ✅ Reprocessed movie: %s", LOG_TAG, skipped.get('name'))
         return True
     except Exception as e:
-        logger.error(f"{LOG_TAG} Reprocess failed: {e}", exc_info=True)
+        logger.error("%s Reprocess failed: %s", LOG_TAG, e, exc_info=True)
         return False
@@ -3,9 +3,10 @@
 import re
 import logging
 
-from typing import List
+from functools import lru_cache
 
 from .streams import write_strm_file
+from strmgen.core.config import on_settings_reload
 from strmgen.core.string_utils import clean_name
 from strmgen.core.models.dispatcharr import DispatcharrStream
 
@@ -13,35 +14,30 @@ logger = logging.getLogger(__name__)
 RE_24_7_CLEAN = re.compile(r"(?i)\b24[/-]7\b[\s\-:]*")
 _skipped_247: set[str] = set()
 
+
+@lru_cache(maxsize=4096)
+def _clean_247_title(name: str) -> str:
+    # 24/7 channel names repeat run after run; clean_name reads remove_strings
+    return clean_name(RE_24_7_CLEAN.sub("", name))
+
+on_settings_reload(_clean_247_title.cache_clear)
+
+
 async def process_24_7(
-    streams: List[DispatcharrStream],
+    stream: DispatcharrStream,
     group: str
 ) -> None:
     """
-    Async processing for 24/7 streams:
+    Async processing for one 24/7 stream:
       - Clean title
-      - Optional TMDb lookup & threshold filter
       - Write .strm file
-      - Write .nfo if enabled
     """
-    # settings = get_settings()
-
-    for stream in streams:
-        try:
-            # 1) Clean the title
-            title = clean_name(RE_24_7_CLEAN.sub("", stream.name))
-            if title in _skipped_247:
-                return
-
-            try:
-                wrote = await write_strm_file(stream)
-            except Exception:
-                logger.exception("Error writing .strm for '%s'", title)
-                return
-
-            if not wrote:
-                return
-        except Exception as e:
-            logger.error("Error processing stream %s: %s", stream.name, e)
-            continue
-    logger.info("Completed processing 24/7 streams for group: %s", group)
+    # 1) Clean the title
+    title = _clean_247_title(stream.name)
+    if title in _skipped_247:
+        return
+
+    try:
+        await write_strm_file(stream)
+    except Exception:
+        logger.exception("Error writing .strm for '%s'", title)
@@ -5,7 +5,7 @@ import httpx
 import logging
 
 from pathlib import Path
-from typing import List, Optional, Any
+from typing import AsyncIterator, List, Optional, Any
 from urllib.parse import quote_plus
 from fastapi import HTTPException
 
@@ -13,23 +13,29 @@ from strmgen.core.config import get_settings
 from strmgen.core.auth import get_auth_headers
 from strmgen.core.models.dispatcharr import DispatcharrStream, MediaType
 from strmgen.core.clients import async_client
+from strmgen.core.db import prefetch_skipped
+from strmgen.core.utils import ensure_dir
 
 logger = logging.getLogger(__name__)
 API_TIMEOUT = 10.0
 
 tag = "[STRM]"
 
-async def fetch_streams_by_group_name(
+async def iter_streams_by_group_name(
     group_name: str,
     stream_type: MediaType,
     updated_only: bool = False,
-) -> List[DispatcharrStream]:
+    prefetch_skips: bool = False,
+) -> AsyncIterator[DispatcharrStream]:
     """
-    Async fetch all Stream entries for a given channel group,
-    with automatic token refresh, returning DispatcharrStream.
+    Async iterate the Stream entries for a given channel group, one page
+    at a time, so callers can start on the first page before the last
+    one has been fetched.
+
+    With prefetch_skips, each page's skip state is loaded in one query
+    before its streams are yielded, so is_skipped needs no round-trip.
     """
     settings = get_settings()
-    out: List[DispatcharrStream] = []
     page = 1
     enc = quote_plus(group_name)
     page_size = 1000
@@ -43,8 +49,6 @@ async def fetch_streams_by_group_name(
             f"?page={page}&page_size={page_size}&ordering=name&channel_group={enc}"
         )
         resp = await _request("GET", url)
-        # stream_count = data.get("count", 0)
-
 
         if not resp.is_success:
             logger.error(
@@ -53,6 +57,7 @@ async def fetch_streams_by_group_name(
             )
             break
         data = resp.json()
+        page_streams: List[DispatcharrStream] = []
         for item in data.get("results", []):
             try:
                 ds = DispatcharrStream.from_dict(
@@ -60,23 +65,28 @@ async def fetch_streams_by_group_name(
                     channel_group_name=group_name,
                     stream_type=stream_type,
                 )
-                if not ds:
-                    continue
-
-                if updated_only:
-                    if ds.stream_updated is None or ds.stream_updated:
-                        out.append(ds)
-                else:
-                    out.append(ds)
             except Exception as e:
                 logger.error("Failed to parse DispatcharrStream for %s: %s", item, e)
+                continue
+            if not ds:
+                continue
+            if updated_only and not (ds.stream_updated is None or ds.stream_updated):
+                continue
+            page_streams.append(ds)
+
+        if prefetch_skips and page_streams:
+            try:
+                await prefetch_skipped(stream_type.name, [ds.id for ds in page_streams])
+            except Exception:
+                # is_skipped falls back to one lookup per stream
+                logger.exception("%s Failed to prefetch skipped streams for group '%s'", tag, group_name)
+        for ds in page_streams:
+            yield ds
 
         if not data.get("next"):
             break
         page += 1
 
-    return out
-
 
 async def is_stream_alive(
     stream_url: str,
@@ -134,28 +144,29 @@ async def write_strm_file(
         logger.warning("%s ⚠️ Stream #%d unreachable, skipping", tag, stream.id)
         return False
 
-    if not settings.update_stream_link and await asyncio.to_thread(stream.strm_path.exists):
-        return True
-
-    # Ensure target directory exists
-    await asyncio.to_thread(stream.strm_path.parent.mkdir, parents=True, exist_ok=True)
-
-    if await is_strm_up_to_date(stream):
+    # exists / mkdir / compare / write all happen in one worker-thread hop
+    outcome = await asyncio.to_thread(
+        _sync_strm_file, stream.strm_path, stream.proxy_url.strip(), settings.update_stream_link
+    )
+    if outcome == "current":
         logger.info("%s ⚠️ .strm up-to-date: %s", tag, stream.strm_path)
-        return True
-
-    # Write the file
-    await asyncio.to_thread(stream.strm_path.write_text, stream.proxy_url.strip(), "utf-8")
-    logger.info("%s ✅ Wrote .strm: %s", tag, stream.strm_path)
+    elif outcome == "written":
+        logger.info("%s ✅ Wrote .strm: %s", tag, stream.strm_path)
     return True
 
 
-async def is_strm_up_to_date(stream: DispatcharrStream, encoding: str = "utf-8") -> bool:
-    path: Path = stream.strm_path
-    if not await asyncio.to_thread(path.exists):
-        return False
-    existing = await asyncio.to_thread(path.read_text, encoding)
-    return existing.strip() == stream.proxy_url.strip()
+def _sync_strm_file(path: Path, url: str, update_link: bool) -> str:
+    """Bring the .strm at path up to date; returns 'kept', 'current' or 'written'."""
+    if not update_link and path.exists():
+        return "kept"
+    ensure_dir(path.parent)
+    try:
+        if path.read_text("utf-8").strip() == url:
+            return "current"
+    except FileNotFoundError:
+        pass
+    path.write_text(url, "utf-8")
+    return "written"
 
 
 async def fetch_groups() -> List[str]:
@@ -1,9 +1,11 @@
 # strmgen/services/tmdb.py
 
 import asyncio
+import os
 import random
+import tempfile
 from difflib import SequenceMatcher
-from typing import Optional, Dict, List, Any, TypeVar
+from typing import Awaitable, Callable, Optional, Dict, List, Any, TypeVar
 from pathlib import Path
 from datetime import datetime
 import logging
@@ -24,6 +26,38 @@ from strmgen.core.models.movie import Movie
 logger = logging.getLogger(__name__)
 
 
+# Title lookups for the current pipeline run, keyed on the normalized query.
+# Each entry is the Task doing the lookup, so concurrent workers asking for the
+# same title share one TMDb round-trip instead of racing their own.
+_lookup_cache: Dict[tuple, "asyncio.Task[Any]"] = {}
+
+
+def clear_tmdb_cache() -> None:
+    """Forget cached title lookups; called at the start of each pipeline run."""
+    _lookup_cache.clear()
+
+
+async def _cached_lookup(key: tuple, factory: Callable[[], Awaitable[Any]]) -> Any:
+    task = _lookup_cache.get(key)
+    if task is None or task.cancelled():
+        task = asyncio.ensure_future(factory())
+        _lookup_cache[key] = task
+    # shield: one cancelled worker must not cancel the lookup others await
+    result = await asyncio.shield(task)
+    if result is None and _lookup_cache.get(key) is task:
+        # misses and transient failures are retried by the next caller
+        del _lookup_cache[key]
+    return result
+
+
+def _retry_after(resp: httpx.Response, backoff: float) -> float:
+    """Seconds to wait after a 429: TMDb's Retry-After if sent, else jittered backoff."""
+    try:
+        return max(float(resp.headers["Retry-After"]), 0.0) + random.random()
+    except (KeyError, ValueError):
+        return backoff + random.random()
+
+
 async def _get(endpoint: str, params: Dict[str, Any]) -> Any:
     """
     Internal TMDb GET with retry/backoff and rate-limit handling.
@@ -38,8 +72,9 @@ async def _get(endpoint: str, params: Dict[str, Any]) -> Any:
                     params={**params, "api_key": settings.tmdb_api_key}
                 )
             if resp.status_code == 429:
-                logger.warning("[TMDB] 429 for %s, backing off %ds", endpoint, backoff)
-                await asyncio.sleep(backoff + random.random())
+                delay = _retry_after(resp, backoff)
+                logger.warning("[TMDB] 429 for %s, backing off %.1fs", endpoint, delay)
+                await asyncio.sleep(delay)
                 backoff = min(backoff * 2, 8)
                 continue
             resp.raise_for_status()
@@ -74,6 +109,16 @@ async def fetch_movie_details(
     title: Optional[str] = None,
     year: Optional[int] = None,
     tmdb_id: Optional[int] = None
+) -> Optional[Movie]:
+    if tmdb_id:
+        return await _fetch_movie_details(title, year, tmdb_id)
+    key = ("movie", (title or "").casefold(), year)
+    return await _cached_lookup(key, lambda: _fetch_movie_details(title, year, None))
+
+async def _fetch_movie_details(
+    title: Optional[str],
+    year: Optional[int],
+    tmdb_id: Optional[int]
 ) -> Optional[Movie]:
     settings = get_settings()
     if not settings.tmdb_api_key:
@@ -98,14 +143,15 @@ async def fetch_movie_details(
             if not results:
                 return None
 
+            # fetch full details for every hit in one wave (tmdb_limiter still paces them)
+            details = await asyncio.gather(*(
+                _get(f"/movie/{r['id']}", append_to) for r in results if r.get("id")
+            ))
+
             candidates: List[Movie] = []
-            for r in results:
-                mid = r.get("id")
-                if not mid:
+            for det in details:
+                if not det:
                     continue
-
-                # fetch full details
-                det = await _get(f"/movie/{mid}", append_to)
                 rel_date = det.get("release_date", "")
                 if rel_date:
                     try:
@@ -211,6 +257,17 @@ async def fetch_tv_details(
     group: str,
     query: Optional[str] = None,
     tv_id: Optional[int] = None
+) -> Optional[TVShow]:
+    if tv_id or not query:
+        return await _fetch_tv_details(group, query, tv_id)
+    # TVShow carries the channel group (it decides the show folder)
+    key = ("tv", group, query.casefold())
+    return await _cached_lookup(key, lambda: _fetch_tv_details(group, query, None))
+
+async def _fetch_tv_details(
+    group: str,
+    query: Optional[str],
+    tv_id: Optional[int]
 ) -> Optional[TVShow]:
     settings = get_settings()
     if not settings.tmdb_api_key:
@@ -278,31 +335,59 @@ async def fetch_tv_details(
         logger.error("[TMDB] fetch_tv_details failed: %s", e)
         return None
 
+def _open_part_file(dest: Path) -> Path:
+    """Create a unique, empty sibling .part file for dest."""
+    fd, name = tempfile.mkstemp(dir=dest.parent, prefix=f".{dest.name}.", suffix=".part")
+    try:
+        # mkstemp creates 0600 files; media servers may read them as another user
+        os.fchmod(fd, 0o644)
+    finally:
+        os.close(fd)
+    return Path(name)
+
 async def _download_image(path_val: str, dest: Path) -> None:
     settings = get_settings()
-    safe_mkdir(dest.parent)
+    await asyncio.to_thread(safe_mkdir, dest.parent)
     url = f"/{settings.tmdb_image_size}{path_val}"
     retries = 3
-    for attempt in range(1, retries+1):
-        try:
-            resp = await tmdb_image_client.get(url)
-            resp.raise_for_status()
-            async with aiofiles.open(dest, "wb") as f:
-                await f.write(resp.content)
-            logger.info("[TMDB] Downloaded image: %s", dest)
-            return
-        except PoolTimeout:
-            if attempt < retries:
-                wait = attempt
-                logger.warning("[TMDB] PoolTimeout, retry %d/%d", attempt, retries)
-                await asyncio.sleep(wait)
-                continue
-            else:
-                logger.error("[TMDB] PoolTimeout giving up on %s", url)
-        except HTTPError as exc:
-            logger.warning("[TMDB] HTTP error on %s: %s", url, exc)
-            return
-    logger.error("[TMDB] Failed to download image after retries: %s", url)
+    # stream into a unique sibling .part file and rename at the end, so an
+    # interrupted download never leaves a truncated image that exists()
+    # would treat as done, and concurrent downloads of the same image
+    # never write into each other's temp file
+    try:
+        tmp = await asyncio.to_thread(_open_part_file, dest)
+    except OSError as exc:
+        logger.warning("[TMDB] Could not create temp file for %s: %s", dest, exc)
+        return
+    try:
+        for attempt in range(1, retries+1):
+            try:
+                async with tmdb_image_client.stream("GET", url) as resp:
+                    resp.raise_for_status()
+                    async with aiofiles.open(tmp, "wb") as f:
+                        async for chunk in resp.aiter_bytes():
+                            await f.write(chunk)
+                await asyncio.to_thread(os.replace, tmp, dest)
+                logger.info("[TMDB] Downloaded image: %s", dest)
+                return
+            except PoolTimeout:
+                if attempt < retries:
+                    wait = attempt
+                    logger.warning("[TMDB] PoolTimeout, retry %d/%d", attempt, retries)
+                    await asyncio.sleep(wait)
+                    continue
+                else:
+                    logger.error("[TMDB] PoolTimeout giving up on %s", url)
+            except HTTPError as exc:
+                logger.warning("[TMDB] HTTP error on %s: %s", url, exc)
+                return
+            except OSError as exc:
+                logger.warning("[TMDB] Could not write image %s: %s", dest, exc)
+                return
+        logger.error("[TMDB] Failed to download image after retries: %s", url)
+    finally:
+        # already gone after a successful os.replace
+        await asyncio.to_thread(tmp.unlink, missing_ok=True)
 
 T = TypeVar("T", Movie, TVShow, SeasonMeta, EpisodeMeta)
 _download_semaphore = asyncio.Semaphore(30)
@@ -322,10 +407,10 @@ async def download_if_missing(
     fanart_path = stream.backdrop_path
     async with _download_semaphore:
         if poster_url and not await asyncio.to_thread(poster_path.exists):
-            logger.info(f"{log_tag} Downloading poster %s", poster_url)
+            logger.info("%s Downloading poster %s", log_tag, poster_url)
             await _download_image(poster_url, poster_path)
         if backdrop_url and not await asyncio.to_thread(fanart_path.exists):
-            logger.info(f"{log_tag} Downloading backdrop %s", backdrop_url)
+            logger.info("%s Downloading backdrop %s", log_tag, backdrop_url)
             await _download_image(backdrop_url, fanart_path)
     return True
 
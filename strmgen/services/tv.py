@@ -1,19 +1,16 @@
 # strmgen/services/tv.py
 
 import asyncio
-import shutil
 import logging
 
-from collections import defaultdict
 from pathlib import Path
-from typing import Dict, Optional, List
-from more_itertools import chunked
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
-from strmgen.core.db import mark_skipped, is_skipped, SkippedStream
+from strmgen.core.db import queue_skipped, flush_skipped, is_skipped, SkippedStream
 from strmgen.core.config import get_settings
 from strmgen.services.tmdb import TVShow, fetch_tv_details, get_season_meta, download_if_missing
 from strmgen.services.subtitles import download_episode_subtitles
-from strmgen.core.utils import filter_by_threshold, write_tvshow_nfo, write_episode_nfo, safe_remove
+from strmgen.core.utils import filter_by_threshold, write_tvshow_nfo, write_episode_nfo, remove_if_exists, ensure_dir
 from strmgen.services.streams import fetch_streams
 from strmgen.core.control import is_running
 from strmgen.core.models.dispatcharr import DispatcharrStream
@@ -38,7 +35,7 @@ async def download_subtitles_if_enabled(
 
     settings = get_settings()
     if settings.opensubtitles_download:
-        logger.info(f"{TAG} 🔽 Downloading subtitles for: {show} S{season:02d}E{ep:02d}")
+        logger.info("%s 🔽 Downloading subtitles for: %s S%02dE%02d", TAG, show, season, ep)
         tmdb_id = mshow.external_ids.get("imdb_id") if mshow and mshow.external_ids else None
         await download_episode_subtitles(
             show,
@@ -48,149 +45,154 @@ async def download_subtitles_if_enabled(
             tmdb_id=tmdb_id or (str(mshow.id) if mshow else None)
         )
 
-async def process_tv(
-    streams: List[DispatcharrStream],
+def _write_episode_strm(path: Path, url: str) -> None:
+    # mkdir + write in one worker-thread hop, off the event loop
+    ensure_dir(path.parent)
+    path.write_text(url, encoding="utf-8")
+
+# Show- and season-level work for the current run, keyed per show/season.
+# Entries are the Tasks doing the work, so every episode of a show that the
+# worker pool picks up concurrently awaits one lookup instead of racing.
+_show_tasks: Dict[Tuple[str, str], "asyncio.Task[Optional[TVShow]]"] = {}
+_season_tasks: Dict[Tuple[str, str, int], "asyncio.Task[Optional[SeasonMeta]]"] = {}
+
+
+def reset_tv_run_state() -> None:
+    """Forget per-run show/season work; called at the start of each pipeline run."""
+    _show_tasks.clear()
+    _season_tasks.clear()
+
+
+def _shared(cache: dict, key: tuple, factory: Callable[[], Awaitable[Any]]) -> Awaitable[Any]:
+    task = cache.get(key)
+    if task is None or task.cancelled():
+        task = asyncio.ensure_future(factory())
+        cache[key] = task
+    # shield: one cancelled episode must not cancel the work its siblings await
+    return asyncio.shield(task)
+
+
+async def _prepare_show(group: str, sample: DispatcharrStream) -> Optional[TVShow]:
+    """Look up, filter and write show-level NFO/artwork once per show."""
+    show_name = sample.name
+    logger.info("%s ▶️ Processing show %r", TAG, show_name)
+
+    # a) Lookup show metadata
+    mshow: Optional[TVShow] = await fetch_tv_details(group, show_name)
+    if not is_running() or not mshow:
+        _skipped.add(show_name)
+        return None
+
+    # b) Threshold check
+    passed = filter_by_threshold(show_name, mshow)
+    if not is_running() or not passed:
+        _skipped.add(show_name)
+        try:
+            await queue_skipped("TV", group, mshow, sample)
+            logger.info("%s 🚫 Threshold filter failed for: %s", TAG, show_name)
+            if await asyncio.to_thread(remove_if_exists, mshow.show_folder):
+                logger.info("%s ✂️ Removed path: %s", TAG, mshow.show_folder)
+        except Exception as e:
+            logger.info("%s Exception occurred: %s", TAG, e)
+        return None
+
+    # c) Write show‑level NFO & artwork
+    if get_settings().write_nfo:
+        await write_tvshow_nfo(sample, mshow)
+        asyncio.create_task(download_if_missing(TAG, sample, mshow))
+    return mshow
+
+
+async def _prepare_season(stream: DispatcharrStream, mshow: TVShow) -> Optional[SeasonMeta]:
+    """Fetch season metadata and schedule its artwork once per season."""
+    logger.info("%s 📅 Fetch season %r S%02d", TAG, stream.name, stream.season)
+    season_meta: Optional[SeasonMeta] = await get_season_meta(stream, mshow)
+    if not season_meta:
+        logger.warning("%s ❌ No metadata for %r S%02d", TAG, stream.name, stream.season)
+        return None
+    asyncio.create_task(download_if_missing(TAG, stream, season_meta))
+    return season_meta
+
+
+async def process_tv_stream(
+    stream: DispatcharrStream,
     group: str,
     reprocess: bool = False
 ) -> None:
+    """
+    Process one episode stream. Show lookup, threshold filtering and
+    season metadata are shared by every episode of the show in this run;
+    the pipeline runner bounds concurrency and handles per-stream errors.
+    """
     settings = get_settings()
-    # 1) Filter out streams missing season/episode
-    streams = [s for s in streams if s.season is not None and s.episode is not None]
+    if stream.season is None or stream.episode is None:
+        return
+    show_name = stream.name
+    if not is_running() or show_name in _skipped:
+        return
 
-    # 2) Group streams by show→season
-    shows: Dict[str, Dict[int, List[DispatcharrStream]]] = defaultdict(lambda: defaultdict(list))
-    for s in streams:
-        shows[s.name][s.season].append(s)
+    if not reprocess and await is_skipped(stream.stream_type.name, stream.id):
+        _skipped.add(show_name)
+        return
 
-    # 3) Chunk into show‑batches
-    show_items = list(shows.items())
-    show_batches = list(chunked(show_items, settings.batch_size))
+    mshow = await _shared(_show_tasks, (group, show_name), lambda: _prepare_show(group, stream))
+    if not is_running() or not mshow:
+        return
+    if settings.write_nfo and settings.update_tv_series_nfo:
+        # only refreshing show NFOs this run
+        return
 
-    async def run_show_batch(batch_idx: int, batch: List):
-        if not is_running():
-            return
+    season_meta = await _shared(
+        _season_tasks,
+        (group, show_name, stream.season),
+        lambda: _prepare_season(stream, mshow),
+    )
+    if not is_running() or not season_meta:
+        return
 
-        logger.info(
-            f"{TAG} 🔷 Starting show‑batch {batch_idx}/{len(show_batches)}: "
-            f"{[name for name,_ in batch]}"
-        )
-        sem_show = asyncio.Semaphore(settings.concurrent_requests)
-
-        async def _process_one_show(item):
-            show_name, seasons = item
-            if not is_running() or show_name in _skipped:
-                return
-
-            async with sem_show:
-                logger.info(f"{TAG} ▶️ Processing show {show_name!r}")
-
-                # a) Lookup & cache show metadata
-                sample = next(iter(next(iter(seasons.values()))))
-                mshow: Optional[TVShow] = await fetch_tv_details(group, show_name)
-                if not is_running() or not mshow:
-                    _skipped.add(show_name)
-                    return
-
-                # b) Threshold check
-                passed = await asyncio.to_thread(filter_by_threshold, show_name, mshow)
-                if not is_running() or not passed:
-                    try:
-                        await mark_skipped("TV", group, mshow, sample)
-                        _skipped.add(show_name)
-                        await asyncio.to_thread(shutil.rmtree, mshow.show_folder)
-                        logger.info(f"{TAG} 🚫 Threshold filter failed for: {show_name}")
-                        if mshow.show_folder.exists():
-                            await asyncio.to_thread(safe_remove, mshow.show_folder)
-                            logger.info(f"{TAG} ✂️ Removed path: {mshow.show_folder}")
-                    except Exception as e:
-                        logger.info(f"{TAG} Exception occurred: {e}")
-
-                    return
-
-                # c) Write show‑level NFO & artwork
-                if settings.write_nfo:
-                    await asyncio.to_thread(write_tvshow_nfo, sample, mshow)
-                    asyncio.create_task(download_if_missing(TAG, sample, mshow))
-                    if settings.update_tv_series_nfo:
-                        return
-
-                # d) Seasons & episode batches
-                for season_num, eps in seasons.items():
-                    if not is_running():
-                        return
-                    logger.info(
-                        f"{TAG} 📅 Fetch season {show_name!r} "
-                        f"S{season_num:02d} ({len(eps)} eps)"
-                    )
-                    season_meta: Optional[SeasonMeta] = await get_season_meta(eps[0], mshow)
-                    if not is_running() or not season_meta:
-                        logger.warning(f"{TAG} ❌ No metadata for {show_name!r} S{season_num:02d}")
-                        continue
-
-                    asyncio.create_task(download_if_missing(TAG, eps[0], season_meta))
-
-                    ep_batches = list(chunked(eps, settings.batch_size))
-                    for ep_idx, ep_batch in enumerate(ep_batches, start=1):
-                        if not is_running():
-                            return
-                        logger.info(
-                            f"{TAG} 🔸 Episode batch {ep_idx}/{len(ep_batches)} "
-                            f"for {show_name!r} S{season_num:02d}"
-                        )
-                        sem_ep = asyncio.Semaphore(settings.concurrent_requests)
-
-                        async def _process_one_ep(stream: DispatcharrStream):
-                            if not is_running():
-                                return
-                            async with sem_ep:
-                                if not is_running():
-                                    return
-                                if not reprocess and await is_skipped(stream.stream_type.name, stream.id):
-                                    _skipped.add(stream.name)
-                                    return
-
-                                # write .strm
-                                ep_meta = season_meta.episode_map.get(stream.episode)  # type: ignore
-                                if not ep_meta:
-                                    return
-                                ep_meta.strm_path.parent.mkdir(parents=True, exist_ok=True)
-                                ep_meta.strm_path.write_text(stream.proxy_url, encoding="utf-8")
-
-                                # per‑episode NFO & artwork
-                                if settings.write_nfo:
-                                    await asyncio.to_thread(write_episode_nfo, stream, ep_meta)
-                                    if ep_meta.still_path:
-                                        asyncio.create_task(
-                                            download_if_missing(TAG, stream, ep_meta)
-                                        )
-
-                                # subtitles
-                                await download_subtitles_if_enabled(
-                                    show_name,
-                                    season_num,
-                                    stream.episode,
-                                    season_meta.season_folder,
-                                    mshow,
-                                )
-
-                        await asyncio.gather(*(_process_one_ep(s) for s in ep_batch))
-                        if not is_running():
-                            return
-                        await asyncio.sleep(settings.batch_delay_seconds)
-
-                logger.info(f"{TAG} ✅ Finished show {show_name!r}")
-
-        # launch this batch of shows
-        await asyncio.gather(*(_process_one_show(item) for item in batch))
-        if not is_running():
-            return
-        await asyncio.sleep(settings.batch_delay_seconds)
-
-    # 4) Kick off all show‑batches in parallel
-    await asyncio.gather(*(
-        run_show_batch(idx, batch)
-        for idx, batch in enumerate(show_batches, start=1)
-    ))
+    # write .strm
+    ep_meta = season_meta.episode_map.get(stream.episode)
+    if not ep_meta:
+        return
+    await asyncio.to_thread(_write_episode_strm, ep_meta.strm_path, stream.proxy_url)
+
+    # per‑episode NFO & artwork
+    if settings.write_nfo:
+        await write_episode_nfo(stream, ep_meta)
+        if ep_meta.still_path:
+            asyncio.create_task(download_if_missing(TAG, stream, ep_meta))
+
+    # subtitles
+    await download_subtitles_if_enabled(
+        show_name,
+        stream.season,
+        stream.episode,
+        season_meta.season_folder,
+        mshow,
+    )
+
+
+async def process_tv(
+    streams: List[DispatcharrStream],
+    group: str,
+    reprocess: bool = False
+) -> None:
+    """Process a list of episode streams (used by reprocess), bounded by concurrent_requests."""
+    settings = get_settings()
+    if reprocess:
+        # give previously skipped shows a fresh lookup
+        for s in streams:
+            _skipped.discard(s.name)
+            _show_tasks.pop((group, s.name), None)
+    sem = asyncio.Semaphore(settings.concurrent_requests)
+
+    async def _one(stream: DispatcharrStream) -> None:
+        async with sem:
+            await process_tv_stream(stream, group, reprocess)
+
+    async with asyncio.TaskGroup() as tg:
+        for stream in streams:
+            tg.create_task(_one(stream))
 
 
 async def reprocess_tv(skipped: SkippedStream) -> bool:
@@ -201,6 +203,7 @@ async def reprocess_tv(skipped: SkippedStream) -> bool:
             return False
 
         await process_tv(streams, skipped["group"], True)
+        await flush_skipped()
         logger.info("✅ Reprocessed TV show %s", skipped["name"])
         return True
     except Exception as e:
@@ -1,5 +1,6 @@
 # strmgen/web_ui/routes.py
 
+import asyncio
 import json
 from pathlib import Path
 
@@ -9,7 +10,7 @@ from fastapi.templating import Jinja2Templates
 from typing import Any
 from starlette.status import HTTP_303_SEE_OTHER
 
-from strmgen.core.config import CONFIG_PATH, reload_settings
+from strmgen.core.config import CONFIG_PATH, reload_settings, write_config
 
 router = APIRouter()
 BASE_DIR = Path(__file__).resolve().parent
@@ -17,6 +18,14 @@ TEMPLATE_DIR = BASE_DIR / "templates"
 templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
 
 
+def _load_config() -> dict[str, Any]:
+    """Raw config.json contents ({} if missing); blocking, run via to_thread."""
+    if not CONFIG_PATH.exists():
+        return {}
+    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 @router.get("/", include_in_schema=False)
 def home_page(request: Request):
     """
@@ -41,13 +50,8 @@ def logs_page(request: Request):
 
 @router.get("/settings", include_in_schema=False, response_class=HTMLResponse)
 async def settings_page(request: Request):
-    # Load existing settings
-    from typing import Any
-
-    cfg: dict[str, Any] = {}
-    if CONFIG_PATH.exists():
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            cfg = json.load(f)
+    # Load existing settings off the event loop
+    cfg = await asyncio.to_thread(_load_config)
     return templates.TemplateResponse("settings.html", {"request": request, "config": cfg})
 
 
@@ -55,10 +59,7 @@ async def settings_page(request: Request):
 async def save_settings(request: Request):
     form = await request.form()
     # Load current config
-    cfg: dict[str, Any] = {}
-    if CONFIG_PATH.exists():
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            cfg = json.load(f)
+    cfg = await asyncio.to_thread(_load_config)
     original: dict[str, Any] = cfg.copy()
 
     # Apply updates from form
@@ -88,8 +89,7 @@ async def save_settings(request: Request):
             cfg[key] = False
 
     # Persist back to config.json
-    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        json.dump(cfg, f, indent=2)
+    await asyncio.to_thread(write_config, cfg)
 
     reload_settings()
 
@@ -8,8 +8,7 @@ const boolFields = [
 ];
 
 const numberFields = [
-  'last_modified_days', 'batch_size', 'batch_delay_seconds',
-  'concurrent_requests', 'tmdb_rate_limit', 'minimum_year',
+  'last_modified_days', 'concurrent_requests', 'tmdb_rate_limit', 'minimum_year',
   'minimum_tmdb_rating', 'minimum_tmdb_votes',
   'minimum_tmdb_popularity', 'scheduled_hour', 'scheduled_minute'
 ];
@@ -0,0 +1,39 @@
+# tests/test_dir_cache.py
+import pytest
+
+from strmgen.core import utils
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    utils.clear_dir_cache()
+    yield
+    utils.clear_dir_cache()
+
+
+def test_safe_remove_forgets_only_the_removed_tree(tmp_path):
+    show = tmp_path / "Show"
+    season = show / "Season 01"
+    sibling = tmp_path / "Show 2"
+    other = tmp_path / "Other"
+    for folder in (season, sibling, other):
+        utils.ensure_dir(folder)
+
+    utils.safe_remove(show)
+
+    assert not show.exists()
+    assert str(season) not in utils._made_dirs
+    # "Show 2" shares the "Show" prefix but is not below it
+    assert str(sibling) in utils._made_dirs
+    assert str(other) in utils._made_dirs
+
+    utils.ensure_dir(season)
+    assert season.is_dir()
+
+
+def test_failed_mkdir_is_not_remembered(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("x")
+    with pytest.raises(OSError):
+        utils.ensure_dir(blocker / "sub")
+    assert str(blocker / "sub") not in utils._made_dirs
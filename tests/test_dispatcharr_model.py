@@ -0,0 +1,33 @@
+# tests/test_dispatcharr_model.py
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from strmgen.core.models.dispatcharr import _parse_updated_at
+
+
+@pytest.mark.parametrize("ts, fmt", [
+    ("2024-05-01T12:34:56.789012Z", "%Y-%m-%dT%H:%M:%S.%fZ"),
+    ("2024-05-01T12:34:56.789Z", "%Y-%m-%dT%H:%M:%S.%fZ"),
+    ("2024-05-01T12:34:56Z", "%Y-%m-%dT%H:%M:%SZ"),
+])
+def test_parse_updated_at_matches_strptime_formats(ts, fmt):
+    expected = datetime.strptime(ts, fmt).replace(tzinfo=timezone.utc)
+    assert _parse_updated_at(ts) == expected
+
+
+def test_parse_updated_at_treats_naive_as_utc():
+    assert _parse_updated_at("2024-05-01T12:34:56") == datetime(
+        2024, 5, 1, 12, 34, 56, tzinfo=timezone.utc
+    )
+
+
+def test_parse_updated_at_converts_offsets_to_utc():
+    parsed = _parse_updated_at("2024-05-01T14:34:56+02:00")
+    assert parsed.utcoffset() == timedelta(0)
+    assert parsed == datetime(2024, 5, 1, 12, 34, 56, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("ts", ["", "not a date", "2024-13-01T00:00:00Z"])
+def test_parse_updated_at_rejects_garbage(ts):
+    assert _parse_updated_at(ts) is None
@@ -0,0 +1,79 @@
+# tests/test_group_patterns.py
+import fnmatch
+import random
+
+import pytest
+
+from strmgen.pipeline.runner import _classify_groups, _compile_patterns
+
+GROUPS = [
+    "",
+    "Movies",
+    "Movies 4K",
+    "UK | Movies",
+    "US: Sports",
+    "4K Movies",
+    "24/7 Cartoons",
+    "TV Shows [EN]",
+    "TV Shows [FR]",
+    "movies",
+    "News*",
+    "a?c",
+    "abc",
+]
+
+PATTERNS = [
+    "Movies",
+    "Movies*",
+    "*Movies",
+    "*Movies*",
+    "*",
+    "**",
+    "",
+    "24/7*",
+    "TV Shows [[]EN]",
+    "TV Shows [!E]*",
+    "a?c",
+    "*[0-9]K*",
+    "US:*Sports",
+    "News[*]",
+]
+
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_single_pattern_matches_like_fnmatch(pattern):
+    match = _compile_patterns((pattern,))
+    for group in GROUPS:
+        assert match(group) == fnmatch.fnmatchcase(group, pattern), (pattern, group)
+
+
+def test_random_pattern_sets_match_like_fnmatch():
+    rng = random.Random(1234)
+    alphabet = "ab* ?[]!|"
+    names = ["".join(rng.choice("ab |") for _ in range(rng.randint(0, 6))) for _ in range(200)]
+    for _ in range(300):
+        patterns = tuple(
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 5)))
+            for _ in range(rng.randint(1, 4))
+        )
+        match = _compile_patterns(patterns)
+        for name in names:
+            expected = any(fnmatch.fnmatchcase(name, p) for p in patterns)
+            assert match(name) == expected, (patterns, name)
+
+
+def test_empty_pattern_list_has_no_matcher():
+    assert _compile_patterns(()) is None
+
+
+def test_classify_groups_allows_multiple_routes_and_skips_disabled():
+    matched = _classify_groups(GROUPS, [
+        (True, ["*Movies*"]),
+        (True, ["Movies*"]),
+        (False, ["*"]),
+        (True, None),
+    ])
+    assert matched[0] == ["Movies", "Movies 4K", "UK | Movies", "4K Movies"]
+    assert matched[1] == ["Movies", "Movies 4K"]
+    assert matched[2] == []
+    assert matched[3] == []
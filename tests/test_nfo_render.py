@@ -0,0 +1,147 @@
+# tests/test_nfo_render.py
+"""
+The NFO renderers in strmgen.core.utils are str-formatted equivalents of
+the Jinja2 templates below; their output must stay byte-identical.
+"""
+from types import SimpleNamespace
+
+import pytest
+from jinja2 import Environment, select_autoescape
+
+from strmgen.core.utils import render_episode_nfo, render_movie_nfo, render_tvshow_nfo
+
+TVSHOW_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<tvshow>
+  <title>{{ show.name | e }}</title>
+  <originaltitle>{{ show.original_name | e }}</originaltitle>
+  <plot>{{ show.overview | e }}</plot>
+  <tmdbid>{{ show.id }}</tmdbid>
+  <year>{{ show.first_air_date[:4] if show.first_air_date else '' }}</year>
+  <premiered>{{ show.first_air_date }}</premiered>
+  <rating>{{ show.vote_average }}</rating>
+  <votes>{{ show.vote_count }}</votes>
+  {% for genre in show.genre_ids %}
+  <genre>{{ genre.name | e }}</genre>
+  {% endfor %}
+  <status>{{ show.raw.get('status', '') }}</status>
+  <studio>{{ show.raw.get('networks', [])[0]['name'] if show.raw.get('networks') else '' }}</studio>
+</tvshow>"""
+
+EPISODE_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<episodedetails>
+  <title>{{ episode.name | e }}</title>
+  <season>{{ episode.season_number }}</season>
+  <episode>{{ episode.episode_number }}</episode>
+  <plot>{{ episode.overview | e }}</plot>
+  <aired>{{ episode.air_date }}</aired>
+  <rating>{{ episode.vote_average }}</rating>
+  <votes>{{ episode.vote_count }}</votes>
+  <tmdbid>{{ episode.id }}</tmdbid>
+</episodedetails>"""
+
+MOVIE_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<movie>
+  <title>{{ movie.title | e }}</title>
+  <originaltitle>{{ movie.original_title | e }}</originaltitle>
+  <sorttitle>{{ movie.title | e }}</sorttitle>
+  <year>{{ movie.release_date[:4] if movie.release_date else '' }}</year>
+  <releasedate>{{ movie.release_date }}</releasedate>
+  <plot>{{ movie.overview | e }}</plot>
+  <runtime>{{ movie.raw.get('runtime', '') }}</runtime>
+  <rating>{{ movie.vote_average }}</rating>
+  <votes>{{ movie.vote_count }}</votes>
+  <tmdbid>{{ movie.id }}</tmdbid>
+  {% for genre in movie.genre_ids %}
+  <genre>{{ genre.name | e }}</genre>
+  {% endfor %}
+  <studio>{{ movie.raw.get('production_companies', [])[0]['name'] if movie.raw.get('production_companies') else '' }}</studio>
+  <country>{{ movie.raw.get('production_countries', [])[0]['name'] if movie.raw.get('production_countries') else '' }}</country>
+  <status>{{ movie.raw.get('status', '') }}</status>
+</movie>"""
+
+env = Environment(
+    autoescape=select_autoescape(["xml"]),
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+
+NASTY = "Tom & Jerry's <\"Best\"> Bits"
+GENRES = [{"name": "Action & Adventure"}, SimpleNamespace(name="Sci-Fi <3")]
+
+
+def _show(**overrides):
+    fields = dict(
+        id=1399,
+        name=NASTY,
+        original_name="Original & Co",
+        overview="A 'plot' > summary",
+        first_air_date="2011-04-17",
+        vote_average=8.4,
+        vote_count=21000,
+        genre_ids=GENRES,
+        raw={"status": "Ended & Done", "networks": [{"name": "H<B>O"}]},
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _episode(**overrides):
+    fields = dict(
+        id=63056,
+        name=NASTY,
+        season_number=1,
+        episode_number=2,
+        overview="\"Quoted\" & <tagged>",
+        air_date="2011-04-24",
+        vote_average=7.9,
+        vote_count=150,
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _movie(**overrides):
+    fields = dict(
+        id=603,
+        title=NASTY,
+        original_title="L'Original",
+        overview="Red pill & blue pill",
+        release_date="1999-03-30",
+        vote_average=8.2,
+        vote_count=25000,
+        genre_ids=GENRES,
+        raw={
+            "runtime": 136,
+            "status": "Released",
+            "production_companies": [{"name": "Village <Roadshow>"}],
+            "production_countries": [{"name": "United States & Co"}],
+        },
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+@pytest.mark.parametrize("show", [
+    _show(),
+    _show(first_air_date="", genre_ids=[], raw={}),
+    _show(overview=None, vote_count=None, raw={"networks": []}),
+])
+def test_tvshow_nfo_matches_template(show):
+    assert render_tvshow_nfo(show) == env.from_string(TVSHOW_TEMPLATE).render(show=show)
+
+
+@pytest.mark.parametrize("episode", [
+    _episode(),
+    _episode(overview="", air_date=None),
+])
+def test_episode_nfo_matches_template(episode):
+    assert render_episode_nfo(episode) == env.from_string(EPISODE_TEMPLATE).render(episode=episode)
+
+
+@pytest.mark.parametrize("movie", [
+    _movie(),
+    _movie(release_date="", genre_ids=[], raw={}),
+    _movie(raw={"production_companies": [], "production_countries": []}),
+])
+def test_movie_nfo_matches_template(movie):
+    assert render_movie_nfo(movie) == env.from_string(MOVIE_TEMPLATE).render(movie=movie)
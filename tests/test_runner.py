@@ -0,0 +1,102 @@
+# tests/test_runner.py
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from strmgen.core.models.enums import MediaType
+from strmgen.pipeline import runner
+
+
+async def _aiter(*names):
+    for n in names:
+        yield SimpleNamespace(name=n)
+
+
+@pytest.fixture(autouse=True)
+def pipeline_env(monkeypatch):
+    monkeypatch.setattr(runner, "is_running", lambda: True)
+    monkeypatch.setattr(runner, "notify_progress", lambda **kw: None)
+
+    async def _flush():
+        return None
+    monkeypatch.setattr(runner, "flush_skipped", _flush)
+
+
+def test_run_group_isolates_stream_failures():
+    seen = []
+
+    async def proc(stream, group):
+        seen.append(stream.name)
+        if stream.name == "bad":
+            raise RuntimeError("boom")
+
+    streams = _aiter("a", "bad", "b", "c")
+    asyncio.run(runner._run_group(streams, "G", proc, MediaType.MOVIE, 2))
+    assert sorted(seen) == ["a", "b", "bad", "c"]
+
+
+def test_run_group_bounds_concurrency():
+    in_flight = 0
+    peak = 0
+
+    async def proc(stream, group):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    streams = _aiter(*map(str, range(20)))
+    asyncio.run(runner._run_group(streams, "G", proc, MediaType.TV, 3))
+    assert peak == 3
+
+
+def test_process_category_continues_after_group_failure(monkeypatch):
+    processed = []
+
+    def fake_iter(group, media_type, **kwargs):
+        async def gen():
+            yield SimpleNamespace(name=f"{group}-1")
+            if group == "broken":
+                raise httpx.RequestError("page 2 failed")
+            yield SimpleNamespace(name=f"{group}-2")
+        return gen()
+
+    async def proc(stream, group):
+        processed.append(stream.name)
+
+    monkeypatch.setattr(runner, "iter_streams_by_group_name", fake_iter)
+    asyncio.run(runner.process_category(
+        ["first", "broken", "last"], proc, MediaType.STREAM_24_7, 2
+    ))
+    assert "first-1" in processed and "first-2" in processed
+    assert "last-1" in processed and "last-2" in processed
+    assert "broken-2" not in processed
+
+
+def test_group_failure_does_not_cancel_sibling_categories(monkeypatch):
+    processed = []
+
+    def fake_iter(group, media_type, **kwargs):
+        async def gen():
+            if group == "broken":
+                raise httpx.RequestError("groups page failed")
+            for i in range(3):
+                await asyncio.sleep(0.01)
+                yield SimpleNamespace(name=f"{group}-{i}")
+        return gen()
+
+    async def proc(stream, group):
+        processed.append(stream.name)
+
+    monkeypatch.setattr(runner, "iter_streams_by_group_name", fake_iter)
+
+    async def main():
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(runner.process_category(["broken"], proc, MediaType.TV, 2))
+            tg.create_task(runner.process_category(["ok"], proc, MediaType.STREAM_24_7, 2))
+
+    asyncio.run(main())
+    assert sorted(processed) == ["ok-0", "ok-1", "ok-2"]
@@ -0,0 +1,59 @@
+# tests/test_skip_prefetch.py
+import asyncio
+
+import pytest
+
+from strmgen.core import db
+
+
+class FakePool:
+    def __init__(self, skipped_ids):
+        self.skipped_ids = set(skipped_ids)
+        self.queries = []
+
+    async def fetch(self, sql, stream_type, ids):
+        self.queries.append(("fetch", stream_type, tuple(ids)))
+        return [(i,) for i in ids if i in self.skipped_ids]
+
+    async def fetchrow(self, sql, stream_type, dispatcharr_id):
+        self.queries.append(("fetchrow", stream_type, dispatcharr_id))
+        return (dispatcharr_id,) if dispatcharr_id in self.skipped_ids else None
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    fake = FakePool({2, 4})
+
+    async def _get_pool():
+        return fake
+    monkeypatch.setattr(db, "get_pg_pool", _get_pool)
+    db.clear_skip_prefetch()
+    yield fake
+    db.clear_skip_prefetch()
+
+
+def test_prefetched_page_needs_one_query(pool):
+    async def main():
+        await db.prefetch_skipped("MOVIE", [1, 2, 3, 4])
+        return [await db.is_skipped("MOVIE", i) for i in (1, 2, 3, 4)]
+
+    assert asyncio.run(main()) == [False, True, False, True]
+    assert pool.queries == [("fetch", "MOVIE", (1, 2, 3, 4))]
+
+
+def test_prefetched_entries_are_used_once(pool):
+    async def main():
+        await db.prefetch_skipped("TV", [4])
+        return await db.is_skipped("TV", 4), await db.is_skipped("TV", 4)
+
+    assert asyncio.run(main()) == (True, True)
+    assert [q[0] for q in pool.queries] == ["fetch", "fetchrow"]
+
+
+def test_prefetch_is_keyed_by_stream_type(pool):
+    async def main():
+        await db.prefetch_skipped("MOVIE", [2])
+        return await db.is_skipped("TV", 2)
+
+    assert asyncio.run(main()) is True
+    assert pool.queries[-1] == ("fetchrow", "TV", 2)
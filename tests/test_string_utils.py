@@ -0,0 +1,100 @@
+# tests/test_string_utils.py
+import random
+import re
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit, urlunsplit
+
+import pytest
+
+from strmgen.core import string_utils
+from strmgen.core.string_utils import clean_name, fix_url_string, remove_prefixes
+
+
+def _sequential_clean(name, tokens):
+    """The original clean_name: replace each token in configured order."""
+    for token in tokens:
+        name = name.replace(token, "")
+    for ch in '<>:"/\\|?*':
+        name = name.replace(ch, "")
+    return name.strip()
+
+
+@pytest.fixture
+def remove_strings(monkeypatch):
+    def _set(tokens):
+        monkeypatch.setattr(string_utils, "_remove_strings", lambda: tuple(tokens or ()))
+    return _set
+
+
+@pytest.mark.parametrize("tokens, name", [
+    (["HD", "FHD"], "FHD"),
+    (["A", "BC"], "BAC"),
+    (["HD", "4K HDR"], "Movie 4K HDR"),
+    (["FHD", "HD"], "Movie FHD HD"),
+    (["UK: ", "|"], "UK: Movie | Title"),
+    ([], '  Bad<>:"/\\|?*Name  '),
+    (["", "x"], "xyz"),
+])
+def test_clean_name_matches_sequential_replace(remove_strings, tokens, name):
+    remove_strings(tokens)
+    assert clean_name(name) == _sequential_clean(name, tokens)
+
+
+@pytest.mark.parametrize("tokens, name, expected", [
+    (["HD", "FHD"], "FHD", "F"),
+    (["A", "BC"], "BAC", ""),
+    (["HD", "4K HDR"], "Movie 4K HDR", "Movie 4K R"),
+])
+def test_clean_name_applies_tokens_in_configured_order(remove_strings, tokens, name, expected):
+    remove_strings(tokens)
+    assert clean_name(name) == expected
+
+
+def test_remove_prefixes_allows_unset_list(remove_strings):
+    remove_strings(None)
+    assert remove_prefixes("Title") == "Title"
+
+
+def test_remove_prefixes_strips_after_each_token(remove_strings):
+    remove_strings(["EN -", " Movie"])
+    # the leading space of " Movie" is gone by the time it is applied
+    assert remove_prefixes("EN - Movie Night") == "Movie Night"
+
+
+def _split_fix_url(raw_url):
+    """The original fix_url_string: always split, collapse, quote and rejoin."""
+    scheme, netloc, path, query, fragment = urlsplit(raw_url)
+    path = quote(re.sub(r"/{2,}", "/", path), safe="/")
+    query = urlencode(parse_qsl(query, keep_blank_values=True), doseq=True)
+    return urlunsplit((scheme, netloc, path, query, fragment))
+
+
+@pytest.mark.parametrize("url", [
+    "http://h:9191/proxy/ts/stream/abc123",
+    "http://h:9191//proxy/ts/stream/abc123",
+    "http://h:9191///",
+    "http://h:9191",
+    "https://host/a b/c:d",
+    "https://host/a//b?x=1 2&y=#frag",
+    "HTTP://host/path",
+    "h2://host/path",
+    "http:///path",
+    "http://ho\tst/path",
+    "http://[::1]:80/path",
+])
+def test_fix_url_string_matches_split_path(url):
+    assert fix_url_string(url) == _split_fix_url(url)
+
+
+def test_fix_url_string_matches_split_path_on_random_urls():
+    rng = random.Random(0)
+    prefixes = ["http://", "https://", "HTTP://", "h2://", "a b://", "", "http:///", "http://h:9191"]
+    alphabet = "ab/:?#% \t\n@Hh.-_~1;=&+"
+    for _ in range(20000):
+        url = rng.choice(prefixes) + "".join(
+            rng.choice(alphabet) for _ in range(rng.randint(0, 14))
+        )
+        try:
+            expected = _split_fix_url(url)
+        except ValueError:
+            continue
+        assert fix_url_string(url) == expected, url